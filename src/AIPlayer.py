@@ -1,32 +1,117 @@
 import math
+import time
+from array import array
+
+from BitBoard import popcount
+from Symmetry import canonical_key, inverse_square, transform_square
 
 
 
 def opponent(color):
     return 'O' if color == 'X' else 'X'
 
-# Table de transposition pour mémoriser les résultats et éviter des recalculs
+# Table de transposition pour mémoriser les résultats et éviter des recalculs.
+# Table de taille fixe (préallouée) : les entrées sont rangées dans des tableaux parallèles (module array)
+# et regroupées par seaux de deux entrées :
+#   - l'entrée 0 est « préférence à la profondeur » : on ne l'écrase que par une recherche au moins aussi
+#     profonde, ou si elle date d'une ancienne génération (partie précédente) ;
+#   - l'entrée 1 est « toujours remplacée ».
+# Chaque entrée mémorise aussi le type de borne de la valeur et le meilleur coup trouvé.
+# En ouverture (jusqu'à symmetry_discs pions), les positions sont rangées sous leur forme canonique (Symmetry.py) :
+# les 8 orientations d'une même position partagent une entrée, dont le coup est noté dans le repère canonique.
+ENTRY_BYTES = 8 + 4 + 1 + 1 + 1 + 2  # clé (Q) + valeur (i) + profondeur (b) + génération (B) + borne (b) + coup (h)
+
+# Type de borne de la valeur stockée
+EXACT = 0
+LOWERBOUND = 1  # échec haut (value >= beta) : la vraie valeur est au moins value
+UPPERBOUND = 2  # échec bas (value <= alpha) : la vraie valeur est au plus value
+
+
 class TranspositionTable:
-    def __init__(self):
-        self.table = {}
+    def __init__(self, size_mb=8, symmetry_discs=0):
+        # Autant de seaux (de 2 entrées) que le budget mémoire en contient : avec des entrées de 17 octets,
+        # arrondir à une puissance de 2 laisserait jusqu'à la moitié du budget inutilisée.
+        # Le seau d'une clé est donc key % buckets (et non un masque)
+        self.buckets = max(1, size_mb * 1024 * 1024 // (2 * ENTRY_BYTES))
+        self.capacity = self.buckets * 2
+        self.keys = array('Q', bytes(8 * self.capacity))
+        self.values = array('i', bytes(4 * self.capacity))
+        self.depths = array('b', [-1]) * self.capacity  # -1 : entrée vide
+        self.generations = array('B', bytes(self.capacity))
+        self.flags = array('b', bytes(self.capacity))
+        self.moves = array('h', [-1]) * self.capacity  # case du meilleur coup (x * size + y), -1 si aucun
+        self.generation = 0
+        self.symmetry_discs = symmetry_discs
+        self.used = 0
+        self.probes = 0
+        self.hits = 0
 
-    def hash_board(self, board):
-        return tuple(tuple(row) for row in board.grid)
+    def new_generation(self):
+        """Nouvelle partie : les entrées existantes deviennent remplaçables en priorité"""
+        self.generation = (self.generation + 1) & 0xFF
 
-    def store(self, board, depth, value):
-        key = self.hash_board(board)
-        self.table[key] = (depth, value)
+    def hash_board(self, board, color):
+        # Clé de Zobrist tenue à jour par make_move/undo_move, combinée avec le joueur qui a le trait
+        return board.hash_key(color)
 
-    def lookup(self, board, depth):
-        key = self.hash_board(board)
-        if key in self.table:
-            stored_depth, value = self.table[key]
+    def store(self, board, depth, value, flag, best_move, color):
+        # En ouverture, clé de la forme canonique et transformation t vers son repère
+        if board.count_o + board.count_x <= self.symmetry_discs:
+            key, t = canonical_key(board, color)
+        else:
+            key, t = self.hash_board(board, color), 0
+        if t and best_move:
+            best_move = transform_square(best_move, t, board.size)
+        slot = (key % self.buckets) << 1
+        depths = self.depths
+        stored_depth = depths[slot]
+        if stored_depth >= 0 and self.generations[slot] == self.generation and depth < stored_depth:
+            slot += 1  # l'entrée profonde est conservée, on écrit dans l'entrée « toujours remplacée »
+            stored_depth = depths[slot]
+        if stored_depth < 0:
+            self.used += 1
+        self.keys[slot] = key
+        self.values[slot] = value
+        depths[slot] = depth
+        self.generations[slot] = self.generation
+        self.flags[slot] = flag
+        self.moves[slot] = best_move[0] * board.size + best_move[1] if best_move else -1
 
-            # On ne remplace que si on a une recherche à une profondeur au moins aussi grande
-            if stored_depth >= depth:
-                return value
+    def lookup(self, board, color):
+        """
+        Retourne (profondeur, valeur, type de borne, meilleur coup) pour la position, ou None.
+        C'est à l'appelant de vérifier que la profondeur stockée est suffisante pour utiliser la valeur ;
+        le meilleur coup reste utile pour l'ordonnancement même si la recherche était moins profonde.
+        """
+        # En ouverture, clé de la forme canonique et transformation t vers son repère
+        if board.count_o + board.count_x <= self.symmetry_discs:
+            key, t = canonical_key(board, color)
+        else:
+            key, t = self.hash_board(board, color), 0
+        slot = (key % self.buckets) << 1
+        self.probes += 1
+        keys = self.keys
+        for entry in (slot, slot + 1):
+            if keys[entry] == key and self.depths[entry] >= 0:
+                self.hits += 1
+                move = self.moves[entry]
+                best_move = divmod(move, board.size) if move >= 0 else None
+                if t and best_move:
+                    best_move = inverse_square(best_move, t, board.size)
+                return self.depths[entry], self.values[entry], self.flags[entry], best_move
         return None
 
+    def fill_rate(self):
+        return self.used / self.capacity
+
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes else 0.0
+
+
+# Levée quand la recherche dépasse l'heure limite (ou est annulée) ; la profondeur en cours est alors abandonnée
+class SearchTimeout(Exception):
+    pass
+
 
 def order_moves(board, moves, current_color):
     """
@@ -46,7 +131,7 @@ def order_moves(board, moves, current_color):
         # Simuler le coup pour obtenir une position
         flips = board.make_move(move, current_color)
         # Critère 2 : mobilité adverse (moins il y a de coups pour l'adversaire, mieux c'est)
-        opp_moves = len(board.get_legal_moves(opponent(current_color)))
+        opp_moves = popcount(board.legal_mask(opponent(current_color)))
         # On prend l'inverse, par exemple : -opp_moves
         mobility_score = -opp_moves
 
@@ -64,25 +149,166 @@ def order_moves(board, moves, current_color):
     return [move for score, move in ordered]
 
 
+# Ordonnancement des coups dans nega_max. Un ordonnanceur fournit :
+#   - order(board, moves, color, depth, tt_move) : les coups triés, le meilleur coup mémorisé en premier ;
+#   - record_cutoff(move, color, depth) : appelé sur chaque coupure beta ;
+#   - new_search() : appelé au début de chaque recherche.
+class MobilityOrdering:
+    """Tri par order_moves (poids, mobilité adverse, évaluation) à tous les nœuds"""
+
+    def new_search(self):
+        pass
+
+    def order(self, board, moves, color, depth, tt_move):
+        moves = order_moves(board, moves, color)
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        return moves
+
+    def record_cutoff(self, move, color, depth):
+        pass
+
+
+class KillerHistoryOrdering(MobilityOrdering):
+    """
+    Tri peu coûteux : le meilleur coup mémorisé d'abord, puis les coups « killer » (coups ayant provoqué
+    une coupure à la même profondeur), puis selon la table d'historique (coupures passées pondérées par
+    la profondeur). order_moves, qui joue chaque coup, n'est utilisé qu'à partir de mobility_depth
+    (près de la racine), là où un bon ordre rapporte le plus.
+    Les killers sont rangés par profondeur restante, ce qui revient au même que par ply dans une itération.
+    """
+
+    def __init__(self, mobility_depth=5):
+        self.mobility_depth = mobility_depth
+        self.killers = {}
+        self.history = {'O': {}, 'X': {}}
+
+    def new_search(self):
+        self.killers = {}
+        # On garde l'historique d'une recherche à l'autre, en atténuant les anciens scores
+        for color in self.history:
+            self.history[color] = {move: score // 2 for move, score in self.history[color].items() if score > 1}
+
+    def order(self, board, moves, color, depth, tt_move):
+        if depth >= self.mobility_depth:
+            return super().order(board, moves, color, depth, tt_move)
+        killers = self.killers.get(depth, ())
+        history = self.history[color]
+
+        def score(move):
+            if move == tt_move:
+                return 1 << 30
+            if move in killers:
+                return 1 << 29
+            return history.get(move, 0)
+
+        moves.sort(key=score, reverse=True)
+        return moves
+
+    def record_cutoff(self, move, color, depth):
+        history = self.history[color]
+        history[move] = history.get(move, 0) + depth * depth
+        killers = self.killers.setdefault(depth, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+
+
+# Réglages de l'IA selon la taille du plateau : les profondeurs et les temps de référence sont ceux du 8x8
+REFERENCE_SIZE = 8
+# Au-delà de cette taille (mode grand plateau), l'IA joue en temps limité par approfondissement itératif
+LARGE_BOARD_SIZE = 10
+# Temps de réflexion par coup en mode grand plateau, pour le facteur de branchement du 8x8
+LARGE_BOARD_MOVE_TIME = 1.0
+MAX_TT_SIZE_MB = 32
+
+
+def branching_factor(size):
+    """
+    Nombre moyen de coups légaux sur un plateau de taille 'size'. Mesuré sur des parties aléatoires
+    (2.7 en 4x4, 8.4 en 8x8, 16.8 en 12x12, 26.1 en 16x16, 35.9 en 20x20), il croît comme size ** 1.5.
+    """
+    return 8.35 * (size / REFERENCE_SIZE) ** 1.5
+
+
+def scaled_depth(depth, size):
+    """Profondeur qui visite à peu près autant de nœuds sur un plateau 'size' que 'depth' sur le 8x8"""
+    ratio = math.log(branching_factor(REFERENCE_SIZE)) / math.log(branching_factor(size))
+    return max(2, round(depth * ratio))
+
+
+def board_settings(size, max_depth=6):
+    """
+    Paramètres de AIPlayer pour un plateau de taille 'size', max_depth étant la profondeur voulue en 8x8 :
+    profondeur ramenée au facteur de branchement, table de transposition proportionnelle au nombre de cases,
+    et au-delà de LARGE_BOARD_SIZE un temps limite par coup (lui aussi proportionnel au branchement)
+    pour que l'IA réponde toujours.
+    """
+    settings = {
+        "max_depth": scaled_depth(max_depth, size),
+        "tt_size_mb": min(MAX_TT_SIZE_MB, max(1, round(8 * (size / REFERENCE_SIZE) ** 2))),
+    }
+    if size > LARGE_BOARD_SIZE:
+        settings["time_limit"] = LARGE_BOARD_MOVE_TIME * branching_factor(size) / branching_factor(REFERENCE_SIZE)
+    return settings
+
+
 # IA basée sur NegaMax avec élagage alpha‑bêta et optimisée avec la méthode mtd(f)
 class AIPlayer:
-    def __init__(self, color, max_depth=4):
+    def __init__(self, color, max_depth=4, tt_size_mb=8, time_limit=None, clock=None, tt=None,
+                 endgame_empties=12, wld_empties=14, ordering=None, book=None, symmetry_discs=0):
+        """
+        Sans limite de temps, l'IA cherche à profondeur fixe max_depth.
+        Avec time_limit (secondes par coup) ou clock (GameClock pour toute la partie), elle procède
+        par approfondissement itératif jusqu'à l'heure limite.
+        tt permet de fournir une table de transposition existante (par exemple une SharedTranspositionTable).
+        En fin de partie, la position est résolue exactement (EndgameSolver) à partir de endgame_empties
+        cases vides, et en gagné / nul / perdu à partir de wld_empties cases vides (None pour désactiver).
+        ordering choisit l'ordonnancement des coups (KillerHistoryOrdering par défaut, ou MobilityOrdering).
+        book (OpeningBook) est consultée avant toute recherche : une position qui s'y trouve est jouée sans chercher.
+        Jusqu'à symmetry_discs pions, la table de transposition range les positions sous leur forme canonique
+        (les orientations symétriques d'une position partagent une entrée ; 0 pour désactiver).
+        """
         self.color = color
         self.max_depth = max_depth
-        self.tt = TranspositionTable()
+        self.tt = tt if tt is not None else TranspositionTable(tt_size_mb, symmetry_discs)
+        self.time_limit = time_limit
+        self.clock = clock
+        self.deadline = None
+        self.stop_event = None  # threading.Event : annule la recherche en cours quand il est levé
+        self.nodes = 0
+        self.last_depth = 0  # dernière profondeur entièrement calculée par choose_move
+        self.endgame_empties = endgame_empties
+        self.wld_empties = wld_empties
+        self.ordering = ordering if ordering is not None else KillerHistoryOrdering()
+        self.book = book
+
+    def new_game(self):
+        """Vieillit la table de transposition : les entrées de la partie précédente seront évincées en premier"""
+        self.tt.new_generation()
+        if self.clock is not None:
+            self.clock.reset()
 
-    def mtdf(self, board, depth, first_guess):
+    def should_stop(self):
+        if self.stop_event is not None and self.stop_event.is_set():
+            return True
+        return self.deadline is not None and time.perf_counter() > self.deadline
+
+    def mtdf(self, board, depth, first_guess, current_color):
         """
         Implémente l'algorithme mtd(f) (multipasses) qui réalise une série de recherches à fenêtre nulle.
         Cette méthode utilise une recherche en profondeur avec une fenêtre [beta-1, beta] très étroite,
         ce qui accélère l'élagage sans réduire la profondeur.
+        Les passes successives ne sont rentables que grâce aux bornes mémorisées dans la table de transposition.
+        La valeur retournée est du point de vue de current_color (le joueur qui a le trait).
         """
         g = first_guess # Première estimation de l'évaluation de la position
         lowerbound = -math.inf
         upperbound = math.inf
         while lowerbound < upperbound:
             beta = g + 1 if g == lowerbound else g # Ajustement dynamique de beta
-            g = self.nega_max(board, depth, beta - 1, beta, self.color)
+            g = self.nega_max(board, depth, beta - 1, beta, current_color)
             if g < beta:
                 upperbound = g # On resserre la borne supérieure
             else:
@@ -97,15 +323,30 @@ class AIPlayer:
         Le NegaMax est une version plus légère (en code) du Minimax. Au lieu d'avoir deux valeurs
         (gain de MAX et gain de MIN), on inverse simplement le signe du score à chaque tour.
         """
+        self.nodes += 1
+        # On ne regarde l'heure (et l'annulation) que tous les 256 nœuds
+        if not self.nodes & 255 and self.should_stop():
+            raise SearchTimeout()
+
         if depth == 0 or board.game_over():
-            return board.evaluate(self.color)
+            return board.evaluate(current_color)
 
-        # Si on a déjà évalué cette position, on retourne la valeur
-        tt_val = self.tt.lookup(board, depth)
-        if tt_val is not None:
-            return tt_val
+        # Si on a déjà évalué cette position, on réutilise la valeur selon son type de borne
+        tt_move = None
+        entry = self.tt.lookup(board, current_color)
+        if entry is not None:
+            tt_depth, tt_val, tt_flag, tt_move = entry
+            if tt_depth >= depth:
+                if tt_flag == EXACT:
+                    return tt_val
+                if tt_flag == LOWERBOUND and tt_val >= beta:
+                    return tt_val
+                if tt_flag == UPPERBOUND and tt_val <= alpha:
+                    return tt_val
 
+        alpha_orig = alpha
         max_value = -math.inf
+        best_move = None
         legal_moves = board.get_legal_moves(current_color)
         if not legal_moves:
             # Pas de coup possible, on passe le tour et on joue pour l'adversaire
@@ -113,42 +354,295 @@ class AIPlayer:
             max_value = max(max_value, value)
             alpha = max(alpha, value)
         else:
-            legal_moves = order_moves(board, legal_moves, current_color)
+            # Le meilleur coup mémorisé est cherché en premier
+            legal_moves = self.ordering.order(board, legal_moves, current_color, depth, tt_move)
             for move in legal_moves:
                 flips = board.make_move(move, current_color)
                 value = -self.nega_max(board, depth - 1, -beta, -alpha, opponent(current_color))
                 board.undo_move(move, flips, current_color)
-                max_value = max(max_value, value)
+                if value > max_value:
+                    max_value = value
+                    best_move = move
                 alpha = max(alpha, value)
                 if alpha >= beta:
+                    self.ordering.record_cutoff(move, current_color, depth)
                     break  # coupure beta
 
-        # On mémorise la valeur dans la table de transposition
-        self.tt.store(board, depth, max_value)
+        # On mémorise la valeur dans la table de transposition avec son type de borne
+        if max_value <= alpha_orig:
+            flag = UPPERBOUND
+        elif max_value >= beta:
+            flag = LOWERBOUND
+        else:
+            flag = EXACT
+        self.tt.store(board, depth, max_value, flag, best_move, current_color)
         return max_value
 
-    def choose_move(self, board):
+    def search_root(self, board, legal_moves, depth, guesses):
         """
-        Choisit le meilleur coup parmi les coups légaux en utilisant la méthode mtd(f) pour évaluer chaque coup.
-        On part d'un premier guess à 0 et on évalue le résultat obtenu pour chaque coup.
+        Évalue les coups de la racine à la profondeur donnée : le premier avec mtd(f), puis chacun des suivants
+        d'abord par un test à fenêtre nulle contre la meilleure valeur connue ; seul un coup qui la bat
+        est évalué exactement par mtd(f). Même recherche à la racine que ParallelAIPlayer, en séquentiel.
+        guesses associe à un coup la valeur trouvée à l'itération précédente (premier guess de mtd(f)).
+        Retourne (meilleur coup, meilleure valeur, valeurs de tous les coups) ; la valeur d'un coup qui
+        n'a pas battu le meilleur n'est qu'une borne supérieure, suffisante pour trier les coups.
         """
         best_move = None
         best_value = -math.inf
-        first_guess = 0
-        legal_moves = board.get_legal_moves(self.color)
-        legal_moves = order_moves(board, legal_moves, self.color)
-        if not legal_moves:
-            return None
+        values = {}
         for move in legal_moves:
             flips = board.make_move(move, self.color)
-            # On évalue la position résultante avec mtd(f)
-            value = -self.mtdf(board, self.max_depth - 1, first_guess)
+            # Valeurs du point de vue de l'adversaire qui a le trait dans la position résultante
+            if best_move is None:
+                value = -self.mtdf(board, depth - 1, -guesses.get(move, 0), opponent(self.color))
+            else:
+                value = -self.nega_max(board, depth - 1, -best_value - 1, -best_value, opponent(self.color))
+                if value > best_value:
+                    # Le coup bat le meilleur : value est une borne inférieure, premier guess de mtd(f)
+                    value = -self.mtdf(board, depth - 1, -value, opponent(self.color))
             board.undo_move(move, flips, self.color)
+            values[move] = value
             if value > best_value:
                 best_value = value
                 best_move = move
-                first_guess = value  # Amélioration du guess pour la prochaine recherche
+        return best_move, best_value, values
+
+    def move_time(self, board):
+        """Temps de réflexion accordé pour ce coup (None en profondeur fixe)"""
+        if self.clock is not None:
+            return self.clock.allocate(board)
+        return self.time_limit
+
+    def iterative_deepening(self, board, legal_moves, time_limit, max_depth=None):
+        """
+        Approfondissement itératif : profondeur 1, 2, 3... jusqu'à l'heure limite.
+        Chaque itération trie les coups de la racine et fournit les premiers guess de mtd(f) pour la suivante.
+        Si l'heure limite tombe au milieu d'une itération, on garde le coup de la dernière profondeur terminée.
+        Sans time_limit, la recherche ne s'arrête qu'à max_depth ou sur stop_event (réflexion anticipée).
+        """
+        start = time.perf_counter()
+        empties = board.size * board.size - board.count('O') - board.count('X')
+        if max_depth is not None:
+            empties = min(empties, max_depth)
+        best_move = legal_moves[0]
+        guesses = {}
+        depth = 0
+        try:
+            while depth < empties:
+                depth += 1
+                # La profondeur 1 est toujours terminée pour avoir un coup à jouer
+                self.deadline = start + time_limit if depth > 1 and time_limit is not None else None
+                best_move, best_value, guesses = self.search_root(board, legal_moves, depth, guesses)
+                self.last_depth = depth
+                legal_moves = sorted(legal_moves, key=guesses.get, reverse=True)
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+        return best_move
+
+    def choose_move(self, board):
+        """
+        Choisit le meilleur coup parmi les coups légaux en utilisant la méthode mtd(f) pour évaluer chaque coup.
+        On part d'un premier guess à 0 et on évalue le résultat obtenu pour chaque coup.
+        La recherche se fait sur une copie bitboard de la position (board.position) et non sur le GameController.
+        """
+        return self.search_position(board.position.copy())
+
+    def search_position(self, board):
+        """
+        Comme choose_move, mais directement sur une position BitBoard, qui est modifiée pendant la recherche
+        (elle doit donc être une copie propre à l'IA, par exemple prise avant de lancer un thread de recherche).
+        Si la recherche est annulée par stop_event en profondeur fixe, SearchTimeout est propagée.
+        """
+        legal_moves = board.get_legal_moves(self.color)
+        if not legal_moves:
+            return None
+        time_limit = self.move_time(board)
+        # Le temps du coup court dès ici : la résolution de fin de partie est comprise dans le budget
+        # et décomptée de la pendule, quelle que soit la façon dont le coup est trouvé
+        start = time.perf_counter()
+        if self.clock is not None:
+            self.clock.start()
+        try:
+            best_move = self.book_or_endgame_move(board, legal_moves, time_limit)
+            if best_move is not None:
+                return best_move
+            self.ordering.new_search()
+            legal_moves = order_moves(board, legal_moves, self.color)
+            if time_limit is None:
+                best_move, best_value, values = self.search_root(board, legal_moves, self.max_depth, {})
+                self.last_depth = self.max_depth
+                return best_move
+            # La recherche heuristique ne dispose que du temps laissé par la résolution de fin de partie
+            return self.iterative_deepening(board, legal_moves, time_limit - (time.perf_counter() - start))
+        finally:
+            if self.clock is not None:
+                self.clock.stop()
+
+    def book_or_endgame_move(self, board, legal_moves, time_limit):
+        """
+        Coup joué sans recherche heuristique : celui de la bibliothèque d'ouvertures si la position s'y trouve,
+        sinon celui de la résolution de fin de partie sous le seuil de cases vides. None si aucun des deux.
+        Commun à search_position et ponder_position.
+        """
+        if self.book is not None:
+            entry = self.book.lookup(board, self.color)
+            # Le coup est vérifié : une collision de clés ne doit pas faire jouer un coup illégal
+            if entry is not None and entry[0] in legal_moves:
+                self.last_depth = self.book.depth
+                return entry[0]
+        empties = board.size * board.size - board.count('O') - board.count('X')
+        if empties <= max(self.wld_empties or 0, self.endgame_empties or 0):
+            return self.solve_endgame(board, empties, time_limit)
+        return None
+
+    def _check_stop(self):
+        if self.should_stop():
+            raise SearchTimeout()
+
+    def solve_endgame(self, board, empties, time_limit):
+        """
+        Résolution de fin de partie : exacte sous endgame_empties cases vides, sinon gagné / nul / perdu.
+        En temps limité, la résolution dispose de la moitié du temps du coup ; si elle n'aboutit pas,
+        retourne None et la recherche heuristique prend le relais avec le temps restant.
+        """
+        from EndgameSolver import EndgameSolver
+
+        exact = self.endgame_empties is not None and empties <= self.endgame_empties
+        if time_limit is not None:
+            self.deadline = time.perf_counter() + time_limit / 2
+        solver = EndgameSolver(board, self._check_stop)
+        try:
+            best_move, score = solver.solve(self.color, exact)
+        except SearchTimeout:
+            if self.stop_event is not None and self.stop_event.is_set():
+                raise
+            return None
+        finally:
+            self.deadline = None
+            self.nodes += solver.nodes
         return best_move
 
+    def predict_reply(self, board):
+        """
+        Coup attendu de l'adversaire dans la position 'board' (où il a le trait) : le meilleur coup mémorisé
+        par la table de transposition pendant notre recherche, à défaut le premier selon order_moves.
+        """
+        color = opponent(self.color)
+        legal_moves = board.get_legal_moves(color)
+        if not legal_moves:
+            return None
+        entry = self.tt.lookup(board, color)
+        if entry is not None and entry[3] in legal_moves:
+            return entry[3]
+        return order_moves(board, legal_moves, color)[0]
+
+    def ponder_position(self, board):
+        """
+        Réflexion anticipée sur 'board' (position attendue après la réponse de l'adversaire) : comme search_position,
+        la bibliothèque d'ouvertures et la résolution de fin de partie passent d'abord ; sinon approfondissement
+        itératif sans limite de temps, jusqu'à max_depth en profondeur fixe, interrompu par stop_event.
+        Remplit la table de transposition et retourne le meilleur coup trouvé.
+        """
+        legal_moves = board.get_legal_moves(self.color)
+        if not legal_moves:
+            return None
+        try:
+            best_move = self.book_or_endgame_move(board, legal_moves, None)
+        except SearchTimeout:
+            # Résolution arrêtée (fin du temps après un ponderhit, ou annulation) : la recherche ci-dessous,
+            # arrêtée elle aussi, rend aussitôt le coup de la profondeur 1
+            best_move = None
+        if best_move is not None:
+            return best_move
+        legal_moves = order_moves(board, legal_moves, self.color)
+        self.ordering.new_search()
+        max_depth = self.max_depth if self.move_time(board) is None else None
+        return self.iterative_deepening(board, legal_moves, None, max_depth)
+
+
+def benchmark_ordering(depths=(4, 5, 6), positions=8, seed=0):
+    """
+    Compare les ordonnancements (MobilityOrdering : l'ancien tri partout, KillerHistoryOrdering) :
+    nœuds visités et temps pour atteindre chaque profondeur, sur les mêmes positions de milieu de partie.
+    """
+    import random
+    from GameController import GameController
+
+    rng = random.Random(seed)
+    boards = []
+    while len(boards) < positions:
+        board = GameController()
+        color = 'O'
+        for _ in range(rng.randint(8, 30)):
+            moves = board.get_legal_moves(color)
+            if moves:
+                board.make_move(rng.choice(moves), color)
+            color = opponent(color)
+        if board.get_legal_moves(color):
+            boards.append((board, color))
+
+    print(f"{'profondeur':>10} {'ordonnancement':>22} {'nœuds':>10} {'temps':>8}")
+    for depth in depths:
+        for ordering in (MobilityOrdering, KillerHistoryOrdering):
+            nodes = 0
+            start = time.perf_counter()
+            for board, color in boards:
+                ai = AIPlayer(color, max_depth=depth, ordering=ordering(), endgame_empties=None, wld_empties=None)
+                ai.choose_move(board)
+                nodes += ai.nodes
+            elapsed = time.perf_counter() - start
+            print(f"{depth:>10} {ordering.__name__:>22} {nodes:>10} {elapsed:>7.2f}s")
+
+
+def benchmark_sizes(sizes=range(4, 21, 2), max_depth=6, max_time=10.0, seed=0):
+    """
+    Passage à l'échelle : pour chaque taille, sur une position de milieu de partie tirée au hasard,
+    temps cumulé de l'approfondissement itératif pour atteindre chaque profondeur (dans la limite
+    de max_time secondes) et nœuds par seconde.
+    """
+    import random
+    from GameController import GameController
+
+    print(f"{'taille':>6} {'coups':>5} {'nœuds/s':>8} " + " ".join(f"{'p' + str(d):>7}" for d in range(1, max_depth + 1)))
+    for size in sizes:
+        rng = random.Random(seed)
+        while True:
+            board = GameController(size)
+            color = 'O'
+            for _ in range(size * size // 4):
+                moves = board.get_legal_moves(color)
+                if moves:
+                    board.make_move(rng.choice(moves), color)
+                color = opponent(color)
+            legal_moves = board.get_legal_moves(color)
+            if legal_moves:
+                break
+        position = board.position.copy()
+        ai = AIPlayer(color, tt_size_mb=board_settings(size)["tt_size_mb"], endgame_empties=None, wld_empties=None)
+        ai.ordering.new_search()
+        legal_moves = order_moves(position, legal_moves, color)
+        times = []
+        guesses = {}
+        start = time.perf_counter()
+        ai.deadline = start + max_time
+        try:
+            for depth in range(1, max_depth + 1):
+                best_move, best_value, guesses = ai.search_root(position, legal_moves, depth, guesses)
+                times.append(time.perf_counter() - start)
+                legal_moves = sorted(legal_moves, key=guesses.get, reverse=True)
+        except SearchTimeout:
+            pass
+        elapsed = time.perf_counter() - start
+        cells = [f"{t:>6.2f}s" for t in times] + [f"{'-':>7}"] * (max_depth - len(times))
+        print(f"{size:>6} {len(board.get_legal_moves(color)):>5} {ai.nodes / elapsed:>8.0f} " + " ".join(cells))
+
 
+if __name__ == "__main__":
+    import sys
 
+    if sys.argv[1:] == ["tailles"]:
+        benchmark_sizes()
+    else:
+        benchmark_ordering()
@@ -0,0 +1,78 @@
+# Cache sur disque des images redimensionnées de l'interface.
+# Redimensionner le fond (fond_bois.png) et les pions avec PIL à chaque lancement coûte cher :
+# l'image redimensionnée est enregistrée une fois en PNG, sous un nom qui dépend du contenu du fichier
+# source (empreinte SHA-1) et de la taille voulue. Aux lancements suivants, elle est chargée directement
+# par tk.PhotoImage (Tk lit le PNG), sans importer PIL.
+
+import hashlib
+import os
+import tkinter as tk
+
+# Répertoire du cache (modifiable par la variable d'environnement OTHELLO_CACHE_DIR)
+CACHE_DIR = os.environ.get("OTHELLO_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "othello")
+
+# Empreintes des fichiers source déjà lus pendant cette exécution
+_HASHES = {}
+
+
+def source_hash(path):
+    """Empreinte SHA-1 du contenu du fichier 'path'"""
+    digest = _HASHES.get(path)
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = _HASHES[path] = hashlib.sha1(f.read()).hexdigest()
+    return digest
+
+
+def _resize(source, size):
+    """Image PIL de 'source' redimensionnée à size=(largeur, hauteur)"""
+    from PIL import Image
+
+    resample = Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.ANTIALIAS
+    return Image.open(source).resize(size, resample)
+
+
+def scaled_image_path(source, size):
+    """
+    Chemin du PNG de 'source' redimensionné à size=(largeur, hauteur), créé s'il n'est pas en cache.
+    PIL n'est importé que dans ce cas. Lève OSError si le cache ne peut pas être écrit.
+    """
+    width, height = size
+    name = os.path.splitext(os.path.basename(source))[0]
+    path = os.path.join(CACHE_DIR, f"{name}-{source_hash(source)[:16]}-{width}x{height}.png")
+    if not os.path.exists(path):
+        image = _resize(source, (width, height))
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Écriture dans un fichier temporaire puis renommage : un lancement concurrent ne lit jamais un PNG partiel
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            image.save(temporary, "PNG")
+            os.replace(temporary, path)
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+    return path
+
+
+def load_photo(source, size):
+    """
+    tk.PhotoImage de 'source' redimensionnée à 'size' (une fenêtre Tk doit exister).
+    Si le cache ne peut pas être créé ou écrit (répertoire personnel en lecture seule...), l'image est
+    redimensionnée en mémoire à chaque lancement, comme avant le cache.
+    """
+    try:
+        path = scaled_image_path(source, size)
+    except OSError:
+        from PIL import ImageTk
+
+        return ImageTk.PhotoImage(_resize(source, tuple(size)))
+    return tk.PhotoImage(file=path)
+
+
+def clear_cache():
+    """Supprime les images en cache (pour mesurer un démarrage à froid)"""
+    if os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith(".png"):
+                os.remove(os.path.join(CACHE_DIR, name))
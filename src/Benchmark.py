@@ -0,0 +1,290 @@
+# Micro-benchmarks du moteur, sans interface : génération des coups, coup joué/annulé, évaluation, copie,
+# tri des coups et recherche complète à profondeur fixe, sur un jeu fixe de positions 8x8.
+# Les résultats (opérations ou nœuds par seconde) sont écrits en JSON et comparés à une référence
+# enregistrée : une baisse au-delà du seuil est signalée comme régression (code de sortie 1).
+# Chaque essai est précédé d'une boucle Python de calibrage et les débits sont comparés rapportés à ce
+# calibrage, ce qui atténue les écarts de vitesse et de charge de la machine. Les nombres de nœuds des
+# recherches ne dépendent pas de la machine et doivent être identiques à la référence.
+# La référence reste propre à chaque machine (benchmark_baseline.<machine>.json, hors du dépôt) : on
+# l'enregistre sur la version de départ avec --update-baseline, puis on compare après modification.
+#
+#   python Benchmark.py --update-baseline    # enregistre la mesure courante comme référence de la machine
+#   python Benchmark.py                      # mesure et compare à la référence de la machine
+#   python Benchmark.py --output res.json    # écrit aussi les résultats
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from AIPlayer import AIPlayer, order_moves
+from GameController import GameController
+
+# Référence propre à la machine (non versionnée)
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             f"benchmark_baseline.{platform.node() or 'local'}.json")
+# Baisse relative tolérée avant de signaler une régression
+DEFAULT_THRESHOLD = 0.10
+# Profondeurs des recherches complètes chronométrées
+SEARCH_DEPTHS = (4, 5)
+
+# Positions 8x8 de l'ouverture à la fin de partie : (trait, pions 'O', pions 'X') en bitboards (bit x * 8 + y)
+POSITIONS = [
+    ('O', 0x0044201000500000, 0x0008180878000000),  # 14 pions
+    ('O', 0x083050080c020000, 0x0040201730140400),  # 20 pions
+    ('O', 0x0004098006000000, 0x00f0347fb8180000),  # 26 pions
+    ('O', 0x0000204080502000, 0x20189c3e3f089f10),  # 32 pions
+    ('O', 0x041c1c44c1492000, 0x006262ba3e26c200),  # 38 pions
+    ('O', 0x00887c6070420f42, 0x3e06021f0cac7028),  # 44 pions
+    ('O', 0x787d4b0308502041, 0x820234fc772c1f14),  # 50 pions
+    ('O', 0x0246a80c2260c200, 0x19b957739d1f395f),  # 54 pions
+]
+
+
+def load_positions(backend=None):
+    """Contrôleurs (GameController) des positions de référence, avec la couleur qui a le trait"""
+    boards = []
+    for color, o, x in POSITIONS:
+        board = GameController(8, backend=backend)
+        board.position = type(board.position).decode((8, o, x), board.weights)
+        board.current_color = color
+        boards.append((board, color))
+    return boards
+
+
+def _calibration_operation():
+    # Boucle Python fixe (opérations sur entiers de 64 bits, comme le moteur) : l'étalon des mesures
+    x = 0x0123456789ABCDEF
+    for i in range(1000):
+        x = ((x << 1) ^ (x >> 3) ^ i) & 0xFFFFFFFFFFFFFFFF
+    return 1000
+
+
+def rate(operation, min_time):
+    """Opérations par seconde de operation() (qui retourne le nombre d'opérations effectuées) sur un essai d'au moins min_time secondes"""
+    count = 0
+    start = time.perf_counter()
+    while True:
+        count += operation()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return count / elapsed
+
+
+def calibrate(min_time=0.2):
+    """Débit de la boucle de calibrage"""
+    return rate(_calibration_operation, min_time)
+
+
+def measure(operation, min_time=0.2, repeat=3):
+    """
+    Retourne (opérations par seconde, débit relatif) de operation() : meilleur de 'repeat' essais d'au moins
+    min_time secondes. Chaque essai est précédé d'un calibrage : le débit relatif (rapport au calibrage
+    mesuré juste avant) suit moins les variations de vitesse de la machine que le débit brut.
+    """
+    best = best_relative = 0.0
+    for _ in range(repeat):
+        reference = calibrate(min_time / 2)
+        value = rate(operation, min_time)
+        best = max(best, value)
+        best_relative = max(best_relative, value / reference)
+    return best, best_relative
+
+
+def bench_legal_moves(boards):
+    def operation():
+        for board, color in boards:
+            # Cache des coups vidé : on mesure la génération elle-même
+            cache = getattr(board.position, "_moves_cache", None)
+            if cache is not None:
+                cache.clear()
+            board.get_legal_moves(color)
+        return len(boards)
+    return operation
+
+
+def bench_make_undo(boards):
+    cases = [(board, color, board.get_legal_moves(color)) for board, color in boards]
+
+    def operation():
+        count = 0
+        for board, color, moves in cases:
+            for move in moves:
+                flips = board.make_move(move, color)
+                board.undo_move(move, flips, color)
+            count += len(moves)
+        return count
+    return operation
+
+
+def bench_evaluate(boards):
+    def operation():
+        for board, color in boards:
+            board.evaluate(color)
+        return len(boards)
+    return operation
+
+
+def bench_clone(boards):
+    def operation():
+        for board, color in boards:
+            board.clone()
+        return len(boards)
+    return operation
+
+
+def bench_order_moves(boards):
+    cases = [(board.position.copy(), color, board.get_legal_moves(color)) for board, color in boards]
+
+    def operation():
+        for position, color, moves in cases:
+            order_moves(position, moves, color)
+        return len(cases)
+    return operation
+
+
+def bench_search(boards, depth, repeat=3, min_time=0.2):
+    """
+    Recherche complète (choose_move) à profondeur fixe, avec une IA neuve par position ; meilleur de 'repeat' essais,
+    chacun précédé d'un calibrage (voir measure)
+    """
+    best = None
+    best_relative = 0.0
+    for _ in range(repeat):
+        reference = calibrate(min_time / 2)
+        nodes = 0
+        elapsed = 0.0
+        for board, color in boards:
+            ai = AIPlayer(color, max_depth=depth, endgame_empties=None, wld_empties=None)
+            # Chaque essai part d'un cache des coups vide, comme une première recherche
+            cache = getattr(board.position, "_moves_cache", None)
+            if cache is not None:
+                cache.clear()
+            # L'allocation de la table de transposition n'est pas comptée
+            start = time.perf_counter()
+            ai.choose_move(board)
+            elapsed += time.perf_counter() - start
+            nodes += ai.nodes
+        if best is None or elapsed < best:
+            best = elapsed
+        best_relative = max(best_relative, nodes / elapsed / reference)
+    return {"nodes": nodes, "seconds": best, "nodes_per_sec": nodes / best, "relative": best_relative}
+
+
+def run(backend=None, min_time=0.2, depths=SEARCH_DEPTHS):
+    """Lance toute la suite et retourne les résultats (dictionnaire sérialisable en JSON)"""
+    boards = load_positions(backend)
+    results = {
+        "meta": {
+            "backend": type(boards[0][0].position).__name__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "calibration": calibrate(min_time),
+        },
+        "ops_per_sec": {},
+        "relative": {},
+        "search": {},
+    }
+    benchmarks = [
+        ("get_legal_moves", bench_legal_moves),
+        ("make_undo_move", bench_make_undo),
+        ("evaluate", bench_evaluate),
+        ("clone", bench_clone),
+        ("order_moves", bench_order_moves),
+    ]
+    for name, bench in benchmarks:
+        results["ops_per_sec"][name], results["relative"][name] = measure(bench(boards), min_time)
+    for depth in depths:
+        results["search"][f"choose_move_depth_{depth}"] = bench_search(boards, depth, min_time=min_time)
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare des résultats à la référence. Retourne la liste des lignes (nom, référence, mesure, rapport, régression).
+    Le rapport est celui des débits relatifs (divisés par le calibrage de chaque essai, voir measure) quand
+    la référence en contient, sinon celui des débits bruts ; une régression est une baisse de plus de
+    'threshold' (0.10 = 10 %).
+    Le nombre de nœuds d'une recherche à profondeur fixe doit être celui de la référence : s'il change, c'est
+    la recherche elle-même qui a changé, ce qui compte comme une régression (à enregistrer avec --update-baseline
+    si le changement est voulu).
+    """
+    rows = []
+    for name, value in results["ops_per_sec"].items():
+        reference = baseline.get("ops_per_sec", {}).get(name)
+        if reference:
+            reference_relative = baseline.get("relative", {}).get(name)
+            if reference_relative:
+                ratio = results["relative"][name] / reference_relative
+            else:
+                ratio = value / reference
+            rows.append((name, reference, value, ratio, ratio < 1 - threshold))
+    for name, value in results["search"].items():
+        reference = baseline.get("search", {}).get(name)
+        if reference:
+            if reference.get("relative"):
+                ratio = value["relative"] / reference["relative"]
+            else:
+                ratio = value["nodes_per_sec"] / reference["nodes_per_sec"]
+            rows.append((name, reference["nodes_per_sec"], value["nodes_per_sec"], ratio, ratio < 1 - threshold))
+            if value["nodes"] != reference["nodes"]:
+                rows.append((f"{name} (nœuds)", reference["nodes"], value["nodes"],
+                             value["nodes"] / reference["nodes"], True))
+    return rows
+
+
+def print_results(results):
+    print(f"Représentation : {results['meta']['backend']}")
+    print(f"{'calibrage':>24} {results['meta']['calibration']:>14.0f} op/s")
+    for name, value in results["ops_per_sec"].items():
+        print(f"{name:>24} {value:>14.0f} op/s")
+    for name, value in results["search"].items():
+        print(f"{name:>24} {value['nodes_per_sec']:>14.0f} nœuds/s  ({value['nodes']} nœuds en {value['seconds']:.2f}s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks du moteur d'Othello")
+    parser.add_argument("--output", help="fichier JSON où écrire les résultats")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="référence JSON à laquelle se comparer")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="baisse relative tolérée avant régression (0.10 = 10 %%)")
+    parser.add_argument("--update-baseline", action="store_true", help="enregistrer la mesure comme nouvelle référence")
+    parser.add_argument("--backend", help="représentation de la position (bitboard, list, numpy)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="durée minimale de chaque essai (secondes)")
+    args = parser.parse_args(argv)
+
+    results = run(args.backend, args.min_time)
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Référence enregistrée dans {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"Pas de référence ({args.baseline}) : lancer avec --update-baseline pour en enregistrer une")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline, args.threshold)
+    if baseline.get("meta", {}).get("calibration"):
+        print(f"\nCalibrage : machine {results['meta']['calibration'] / baseline['meta']['calibration']:.2f} fois "
+              f"plus rapide que celle de la référence ; les rapports comparent les débits relatifs au calibrage")
+    print(f"\n{'mesure':>24} {'référence':>12} {'actuel':>12} {'rapport':>8}")
+    for name, reference, value, ratio, regression in rows:
+        print(f"{name:>24} {reference:>12.0f} {value:>12.0f} {ratio:>8.2f}" + ("  RÉGRESSION" if regression else ""))
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f"\nRégression (baisse de plus de {args.threshold:.0%} ou nœuds différents) : {', '.join(regressions)}")
+        return 1
+    print(f"\nAucune régression de plus de {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+# Représentation du plateau par bitboards : un entier par couleur, un bit par case.
+# La case (x, y) correspond au bit x * size + y. Pour un 8x8 on a donc deux masques de 64 bits,
+# mais les entiers Python n'ayant pas de taille fixe, la même classe fonctionne pour toute taille paire.
+
+import random
+
+# Tables précalculées par taille de plateau (masques de bord, décalages, coordonnées des bits)
+_TABLES = {}
+# Clés de Zobrist par taille de plateau
+_ZOBRIST = {}
+# Coups légaux déjà calculés, par taille de plateau puis par clé de position (trait compris)
+_MOVES_CACHE = {}
+# Taille maximale d'un cache de coups avant qu'il soit vidé
+MOVES_CACHE_SIZE = 1 << 16
+
+
+def _build_tables(size):
+    full = (1 << (size * size)) - 1
+    not_first_col = 0
+    not_last_col = 0
+    for x in range(size):
+        for y in range(size):
+            if y != 0:
+                not_first_col |= 1 << (x * size + y)
+            if y != size - 1:
+                not_last_col |= 1 << (x * size + y)
+
+    # Pour chaque direction (dx, dy) : décalage du bit et masque à appliquer APRÈS le décalage
+    # pour éliminer les pions qui auraient « traversé » un bord gauche/droit.
+    shifts = []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            if dx == 0 and dy == 0:
+                continue
+            mask = full
+            if dy == 1:
+                mask &= not_first_col
+            elif dy == -1:
+                mask &= not_last_col
+            shifts.append((dx * size + dy, mask))
+    left = tuple((s, m) for s, m in shifts if s > 0)
+    right = tuple((-s, m) for s, m in shifts if s < 0)
+
+    coords = tuple((i // size, i % size) for i in range(size * size))
+    bits = {coord: 1 << i for i, coord in enumerate(coords)}
+    return full, left, right, coords, bits
+
+
+def get_tables(size):
+    tables = _TABLES.get(size)
+    if tables is None:
+        tables = _TABLES[size] = _build_tables(size)
+    return tables
+
+
+def get_zobrist(size):
+    """
+    Clés de Zobrist (64 bits) : une par case et par couleur, une pour le trait aux blancs ('X').
+    Le générateur est initialisé avec une graine fixe pour que les clés soient identiques
+    d'une exécution (ou d'un processus) à l'autre.
+    """
+    zobrist = _ZOBRIST.get(size)
+    if zobrist is None:
+        rng = random.Random(size)
+        z_o = tuple(rng.getrandbits(64) for _ in range(size * size))
+        z_x = tuple(rng.getrandbits(64) for _ in range(size * size))
+        # Retourner un pion revient à retirer une couleur et à poser l'autre
+        z_flip = tuple(a ^ b for a, b in zip(z_o, z_x))
+        z_side = rng.getrandbits(64)
+        zobrist = _ZOBRIST[size] = (z_o, z_x, z_flip, z_side)
+    return zobrist
+
+
+def popcount(mask):
+    return bin(mask).count("1")
+
+
+class BitBoard:
+    """
+    Position d'Othello sur bitboards. Expose la même interface que GameController
+    (get_legal_moves / make_move / undo_move / evaluate / game_over...) afin que l'IA
+    puisse l'utiliser directement comme plateau de recherche.
+    Ici make_move retourne le masque (int) des pions retournés, que undo_move sait annuler.
+    """
+    __slots__ = ("size", "weights", "flat_weights", "o", "x", "key", "score", "count_o", "count_x",
+                 "_full", "_left", "_right", "_coords", "_bits", "_zobrist", "_moves_cache")
+
+    def __init__(self, size=8, weights=None):
+        self.size = size
+        self.weights = weights
+        self.flat_weights = tuple(w for row in weights for w in row) if weights else (0,) * (size * size)
+        self._full, self._left, self._right, self._coords, self._bits = get_tables(size)
+        self._zobrist = get_zobrist(size)
+        self._moves_cache = _MOVES_CACHE.setdefault(size, {})
+        self.reset()
+
+    def reset(self):
+        """Remet les 4 pions centraux"""
+        size = self.size
+        mid1 = size // 2 - 1
+        mid2 = size // 2
+        self.x = (1 << (mid1 * size + mid1)) | (1 << (mid2 * size + mid2))
+        self.o = (1 << (mid1 * size + mid2)) | (1 << (mid2 * size + mid1))
+        self.refresh()
+
+    def refresh(self):
+        """Recalcule à partir de zéro ce que make_move/undo_move tiennent à jour (clé, score, nombre de pions)"""
+        self.key = self.compute_key()
+        weights = self.flat_weights
+        self.score = 0  # somme des poids des pions 'O' - somme des poids des pions 'X'
+        for i in range(self.size * self.size):
+            bit = 1 << i
+            if self.o & bit:
+                self.score += weights[i]
+            elif self.x & bit:
+                self.score -= weights[i]
+        self.count_o = popcount(self.o)
+        self.count_x = popcount(self.x)
+
+    def compute_key(self):
+        """Clé de Zobrist des pions posés, calculée à partir de zéro (make_move/undo_move la tiennent à jour)"""
+        z_o, z_x = self._zobrist[0], self._zobrist[1]
+        key = 0
+        for i in range(self.size * self.size):
+            bit = 1 << i
+            if self.o & bit:
+                key ^= z_o[i]
+            elif self.x & bit:
+                key ^= z_x[i]
+        return key
+
+    def hash_key(self, color):
+        """Clé de la position avec le trait à 'color' (pour la table de transposition)"""
+        if color == 'X':
+            return self.key ^ self._zobrist[3]
+        return self.key
+
+    def copy(self):
+        new_board = BitBoard.__new__(BitBoard)
+        new_board.size = self.size
+        new_board.weights = self.weights
+        new_board.flat_weights = self.flat_weights
+        new_board._full, new_board._left, new_board._right = self._full, self._left, self._right
+        new_board._coords, new_board._bits = self._coords, self._bits
+        new_board._zobrist = self._zobrist
+        new_board._moves_cache = self._moves_cache
+        new_board.o = self.o
+        new_board.x = self.x
+        new_board.key = self.key
+        new_board.score = self.score
+        new_board.count_o = self.count_o
+        new_board.count_x = self.count_x
+        return new_board
+
+    clone = copy
+
+    def encode(self):
+        """Encodage compact (taille, pions 'O', pions 'X') pour transmettre la position à un autre processus"""
+        return self.size, self.o, self.x
+
+    @classmethod
+    def decode(cls, encoded, weights=None):
+        size, o, x = encoded
+        board = cls(size, weights)
+        board.o = o
+        board.x = x
+        board.refresh()
+        return board
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.size and 0 <= y < self.size
+
+    def _masks(self, color):
+        """Retourne (pions du joueur, pions de l'adversaire)"""
+        if color == 'O':
+            return self.o, self.x
+        return self.x, self.o
+
+    @property
+    def grid(self):
+        """Rendu en liste de listes 'X'/'O'/'.' (affichage, interface graphique)"""
+        size = self.size
+        grid = [['.'] * size for _ in range(size)]
+        for i, (x, y) in enumerate(self._coords):
+            bit = 1 << i
+            if self.o & bit:
+                grid[x][y] = 'O'
+            elif self.x & bit:
+                grid[x][y] = 'X'
+        return grid
+
+    def _moves_entry(self, color):
+        """
+        Entrée du cache des coups pour la position courante avec le trait à 'color' : [o, x, masque, liste].
+        Le cache est indexé par la clé de Zobrist : make_move/undo_move, en changeant la clé, changent
+        d'entrée, et chaque position n'est générée qu'une fois. Les pions (o, x) sont vérifiés
+        pour écarter les collisions de clés. La liste des coups n'est construite qu'à la demande.
+        """
+        key = self.key ^ self._zobrist[3] if color == 'X' else self.key
+        cache = self._moves_cache
+        entry = cache.get(key)
+        if entry is None or entry[0] != self.o or entry[1] != self.x:
+            own, opp = self._masks(color)
+            if len(cache) >= MOVES_CACHE_SIZE:
+                cache.clear()
+            entry = cache[key] = [self.o, self.x, self.legal_mask_for(own, opp), None]
+        return entry
+
+    def legal_mask(self, color):
+        """Masque de tous les coups légaux de 'color'"""
+        return self._moves_entry(color)[2]
+
+    def legal_mask_for(self, own, opp):
+        """Masque des coups légaux du joueur 'own', calculé par propagation (décalages) dans les 8 directions"""
+        empty = ~(own | opp) & self._full
+        steps = self.size - 3  # longueur maximale d'une ligne de pions adverses : size - 2
+        moves = 0
+        for s, mask in self._left:
+            m = opp & mask
+            t = (own << s) & m
+            for _ in range(steps):
+                t |= (t << s) & m
+            moves |= (t << s) & mask & empty
+        for s, mask in self._right:
+            m = opp & mask
+            t = (own >> s) & m
+            for _ in range(steps):
+                t |= (t >> s) & m
+            moves |= (t >> s) & mask & empty
+        return moves
+
+    def flips_mask(self, bit, color):
+        """Masque des pions retournés si 'color' joue sur la case 'bit' (0 si aucun)"""
+        own, opp = self._masks(color)
+        return self.flips_mask_for(bit, own, opp)
+
+    def flips_mask_for(self, bit, own, opp):
+        """Masque des pions de 'opp' retournés si le joueur 'own' joue sur la case 'bit'"""
+        flipped = 0
+        for s, mask in self._left:
+            f = 0
+            t = (bit << s) & mask
+            while t & opp:
+                f |= t
+                t = (t << s) & mask
+            if t & own:
+                flipped |= f
+        for s, mask in self._right:
+            f = 0
+            t = (bit >> s) & mask
+            while t & opp:
+                f |= t
+                t = (t >> s) & mask
+            if t & own:
+                flipped |= f
+        return flipped
+
+    def get_legal_moves(self, color):
+        entry = self._moves_entry(color)
+        moves = entry[3]
+        if moves is None:
+            moves = []
+            coords = self._coords
+            mask = entry[2]
+            while mask:
+                bit = mask & -mask
+                moves.append(coords[bit.bit_length() - 1])
+                mask ^= bit
+            moves = entry[3] = tuple(moves)
+        # Copie : l'appelant peut modifier sa liste sans toucher au cache
+        return list(moves)
+
+    def is_valid_move(self, x, y, color):
+        bit = self._bits[(x, y)]
+        if (self.o | self.x) & bit:
+            return False
+        return self.flips_mask(bit, color) != 0
+
+    def count_flips(self, x, y, color):
+        """Compte le nombre de pions retournés pour un coup donné (utilisé pour l'affichage)"""
+        return popcount(self.flips_mask(self._bits[(x, y)], color))
+
+    def make_move(self, move, color):
+        """
+        Applique le coup move=(x,y) et retourne le masque des pions retournés pour pouvoir annuler le coup.
+        La clé de Zobrist, le score pondéré et le nombre de pions sont mis à jour au passage.
+        """
+        bit = self._bits[move]
+        flips = self.flips_mask(bit, color)
+        key_delta, weight, flipped = self._move_delta(bit, flips, color)
+        if color == 'O':
+            self.o |= bit | flips
+            self.x &= ~flips
+            self.score += weight
+            self.count_o += flipped + 1
+            self.count_x -= flipped
+        else:
+            self.x |= bit | flips
+            self.o &= ~flips
+            self.score -= weight
+            self.count_x += flipped + 1
+            self.count_o -= flipped
+        self.key ^= key_delta
+        return flips
+
+    def _move_delta(self, bit, flips, color):
+        """
+        Effet d'un coup (identique pour le jouer et pour l'annuler) :
+        (variation de la clé de Zobrist, poids gagné par le joueur, nombre de pions retournés)
+        """
+        z_o, z_x, z_flip = self._zobrist[0], self._zobrist[1], self._zobrist[2]
+        weights = self.flat_weights
+        index = bit.bit_length() - 1
+        key_delta = z_o[index] if color == 'O' else z_x[index]
+        weight = weights[index]
+        flipped = 0
+        while flips:
+            flip = flips & -flips
+            index = flip.bit_length() - 1
+            key_delta ^= z_flip[index]
+            # Un pion retourné est retiré à l'adversaire et donné au joueur
+            weight += 2 * weights[index]
+            flipped += 1
+            flips ^= flip
+        return key_delta, weight, flipped
+
+    def undo_move(self, move, flips, color):
+        """Annule le coup et restaure les pièces retournées"""
+        bit = self._bits[move]
+        key_delta, weight, flipped = self._move_delta(bit, flips, color)
+        if color == 'O':
+            self.o ^= bit | flips
+            self.x |= flips
+            self.score -= weight
+            self.count_o -= flipped + 1
+            self.count_x += flipped
+        else:
+            self.x ^= bit | flips
+            self.o |= flips
+            self.score += weight
+            self.count_x -= flipped + 1
+            self.count_o += flipped
+        self.key ^= key_delta
+
+    def flipped_squares(self, flips):
+        """Cases (x, y) des pions retournés, 'flips' étant le masque retourné par make_move"""
+        coords = self._coords
+        squares = []
+        while flips:
+            bit = flips & -flips
+            squares.append(coords[bit.bit_length() - 1])
+            flips ^= bit
+        return squares
+
+    def flips_from_squares(self, squares):
+        """Inverse de flipped_squares : masque à passer à undo_move"""
+        bits = self._bits
+        mask = 0
+        for square in squares:
+            mask |= bits[square]
+        return mask
+
+    def is_full(self):
+        return self.count_o + self.count_x == self.size * self.size
+
+    def count(self, color):
+        """Compte le nombre de pions d'une couleur sur le plateau"""
+        return self.count_o if color == 'O' else self.count_x
+
+    def game_over(self):
+        """Plateau plein ou aucun des deux joueurs ne peut jouer (les deux masques viennent du cache des coups)"""
+        if self.is_full():
+            return True
+        return not self.legal_mask('O') and not self.legal_mask('X')
+
+    def evaluate(self, color):
+        """
+        Fonction d'évaluation statique basée sur la grille de poids.
+        (somme des poids des cases occupées par le joueur - somme des poids des cases occupées par l'adversaire)
+        Le score est tenu à jour par make_move/undo_move : l'évaluation ne parcourt plus la grille.
+        """
+        return self.score if color == 'O' else -self.score
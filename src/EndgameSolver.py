@@ -0,0 +1,220 @@
+from BitBoard import BitBoard, popcount
+
+# Résolution exacte de fin de partie.
+# Quand il reste peu de cases vides, l'arbre complet jusqu'à la fin de la partie peut être parcouru :
+# on calcule alors le score final exact (différence de pions) au lieu de l'heuristique create_weights.
+# Le solveur travaille directement sur les masques (joueur qui a le trait, adversaire) du BitBoard.
+
+INFINITY = 1 << 20
+# Au-delà de ce nombre de cases vides, les coups sont triés par mobilité adverse (« fastest first ») ;
+# en dessous, le tri par parité suffit et coûte beaucoup moins cher
+FASTEST_FIRST_EMPTIES = 6
+# Nombre de cases vides à partir duquel on passe aux routines spécialisées sans génération de coups
+SMALL_EMPTIES = 3
+# Les bornes ne sont mémorisées que pour les nœuds proches de la racine (au-delà, le coût de la table dépasse le gain)
+TABLE_EMPTIES = 8
+
+
+def final_score(own, opp, empties):
+    """Score final du point de vue de 'own' : les cases vides restantes reviennent au gagnant"""
+    diff = popcount(own) - popcount(opp)
+    if diff > 0:
+        return diff + empties
+    if diff < 0:
+        return diff - empties
+    return diff
+
+
+def _quadrant_masks(size):
+    """Masques des 4 quadrants du plateau (régions utilisées pour la parité)"""
+    half = size // 2
+    quadrants = [0, 0, 0, 0]
+    for x in range(size):
+        for y in range(size):
+            quadrants[(x >= half) * 2 + (y >= half)] |= 1 << (x * size + y)
+    return quadrants
+
+
+class EndgameSolver:
+    def __init__(self, board, check_stop=None):
+        """
+        board : BitBoard dont on utilise la taille et la génération de coups (sa position n'est pas modifiée) ;
+        une position d'une autre représentation est d'abord convertie en BitBoard.
+        check_stop : fonction appelée tous les 1024 nœuds ; elle interrompt la résolution en levant
+        une exception (SearchTimeout pour l'IA).
+        """
+        if not isinstance(board, BitBoard):
+            board = BitBoard.decode(board.encode(), board.weights)
+        self.board = board
+        self.size = board.size
+        self.full = (1 << (board.size * board.size)) - 1
+        self.quadrants = _quadrant_masks(board.size)
+        self.check_stop = check_stop
+        self.nodes = 0
+        # Bornes (inférieure, supérieure) déjà établies pour une position (own, opp)
+        self.bounds = {}
+
+    def solve(self, color, exact=True):
+        """
+        Résout la position de self.board avec le trait à 'color'.
+        exact=True : score final exact (différence de pions) ; exact=False : seulement gagné / nul / perdu
+        (score 1 / 0 / -1), beaucoup plus rapide grâce à la fenêtre [-1, 1].
+        Retourne (meilleur coup, score), le coup valant None si 'color' doit passer.
+        """
+        board = self.board
+        own, opp = (board.o, board.x) if color == 'O' else (board.x, board.o)
+        alpha, beta = (-INFINITY, INFINITY) if exact else (-1, 1)
+        moves = board.legal_mask_for(own, opp)
+        if not moves:
+            score = -self._negamax(opp, own, -beta, -alpha, True)
+            return None, score if exact else (score > 0) - (score < 0)
+        best_move = None
+        best = -INFINITY
+        for bit in self._order(own, opp, moves):
+            flips = board.flips_mask_for(bit, own, opp)
+            score = -self._negamax(opp ^ flips, own | bit | flips, -beta, -alpha, False)
+            if score > best:
+                best = score
+                best_move = divmod(bit.bit_length() - 1, self.size)
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        if not exact:
+            best = (best > 0) - (best < 0)
+        return best_move, best
+
+    def _check_stop(self):
+        self.nodes += 1
+        if not self.nodes & 1023 and self.check_stop is not None:
+            self.check_stop()
+
+    def _order(self, own, opp, moves):
+        """
+        Ordonne les coups : d'abord les régions (quadrants) contenant un nombre impair de cases vides (parité),
+        puis, loin de la fin, les coups qui laissent le moins de coups à l'adversaire (fastest first).
+        """
+        empties = ~(own | opp) & self.full
+        odd = 0
+        for quadrant in self.quadrants:
+            if popcount(empties & quadrant) & 1:
+                odd |= quadrant
+        bits = []
+        while moves:
+            bit = moves & -moves
+            bits.append(bit)
+            moves ^= bit
+        if popcount(empties) > FASTEST_FIRST_EMPTIES:
+            board = self.board
+            scored = []
+            for bit in bits:
+                flips = board.flips_mask_for(bit, own, opp)
+                mobility = popcount(board.legal_mask_for(opp ^ flips, own | bit | flips))
+                scored.append((mobility * 2 - (1 if bit & odd else 0), bit))
+            scored.sort()
+            return [bit for _, bit in scored]
+        return [bit for bit in bits if bit & odd] + [bit for bit in bits if not bit & odd]
+
+    def _negamax(self, own, opp, alpha, beta, passed):
+        empties = ~(own | opp) & self.full
+        n_empties = popcount(empties)
+        if n_empties <= SMALL_EMPTIES:
+            squares = []
+            while empties:
+                bit = empties & -empties
+                squares.append(bit)
+                empties ^= bit
+            # Le nœud est compté par _solve_small (ou _solve_last)
+            return self._solve_small(own, opp, alpha, beta, squares, passed)
+        self._check_stop()
+
+        key = None
+        if n_empties >= TABLE_EMPTIES:
+            key = (own, opp)
+            bounds = self.bounds.get(key)
+            if bounds is not None:
+                lower, upper = bounds
+                if lower >= beta:
+                    return lower
+                if upper <= alpha:
+                    return upper
+                if lower == upper:
+                    return lower
+                alpha = max(alpha, lower)
+                beta = min(beta, upper)
+        alpha_orig = alpha
+
+        board = self.board
+        moves = board.legal_mask_for(own, opp)
+        if not moves:
+            if passed:
+                return final_score(own, opp, n_empties)
+            return -self._negamax(opp, own, -beta, -alpha, True)
+        best = -INFINITY
+        for bit in self._order(own, opp, moves):
+            flips = board.flips_mask_for(bit, own, opp)
+            score = -self._negamax(opp ^ flips, own | bit | flips, -beta, -alpha, False)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if key is not None:
+            lower, upper = self.bounds.get(key, (-INFINITY, INFINITY))
+            if best <= alpha_orig:
+                upper = min(upper, best)
+            elif best >= beta:
+                lower = max(lower, best)
+            else:
+                lower = upper = best
+            self.bounds[key] = (lower, upper)
+        return best
+
+    def _solve_small(self, own, opp, alpha, beta, squares, passed):
+        """
+        Dernières cases vides (3 au plus) : on essaie directement chaque case vide, sans générer
+        le masque des coups ni les trier. La case seule d'une région est essayée en premier (parité).
+        """
+        if len(squares) == 1:
+            return self._solve_last(own, opp, squares[0])
+        self._check_stop()
+        if len(squares) == 3:
+            # Parité : la case qui est seule dans son quadrant en premier
+            for i, bit in enumerate(squares):
+                quadrant = next(q for q in self.quadrants if q & bit)
+                if sum(1 for other in squares if other & quadrant) == 1:
+                    if i:
+                        squares = [bit] + squares[:i] + squares[i + 1:]
+                    break
+        board = self.board
+        best = -INFINITY
+        for i, bit in enumerate(squares):
+            flips = board.flips_mask_for(bit, own, opp)
+            if flips:
+                rest = squares[:i] + squares[i + 1:]
+                score = -self._solve_small(opp ^ flips, own | bit | flips, -beta, -alpha, rest, False)
+                if score > best:
+                    best = score
+                    if score > alpha:
+                        alpha = score
+                        if alpha >= beta:
+                            break
+        if best == -INFINITY:
+            if passed:
+                return final_score(own, opp, len(squares))
+            return -self._solve_small(opp, own, -beta, -alpha, squares, True)
+        return best
+
+    def _solve_last(self, own, opp, bit):
+        """Dernière case vide : le score se calcule directement"""
+        self.nodes += 1
+        board = self.board
+        flips = board.flips_mask_for(bit, own, opp)
+        if flips:
+            return popcount(own) - popcount(opp) + 2 * popcount(flips) + 1
+        flips = board.flips_mask_for(bit, opp, own)
+        if flips:
+            return popcount(own) - popcount(opp) - 2 * popcount(flips) - 1
+        return final_score(own, opp, 1)
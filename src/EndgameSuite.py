@@ -0,0 +1,204 @@
+# Suite de positions de fin de partie, dans l'esprit des tests FFO : chaque position est résolue
+# (par EndgameSolver, ou par AIPlayer avec --ai) et comparée aux meilleurs coups et au score exact connus.
+#
+# Format texte, une position par ligne ('#' commence un commentaire) :
+#   <plateau> <trait> [<meilleurs coups> <score>]
+#   plateau : size * size caractères, ligne par ligne : 'O', 'X', ou '-' pour une case vide (64 en 8x8)
+#   trait : 'O' ou 'X'
+#   meilleurs coups : tous les coups qui atteignent le score, séparés par des virgules, en notation
+#                     colonne-ligne (a1 = case (0, 0), h8 = case (7, 7))
+#   score : différence de pions finale (cases vides au gagnant) du point de vue du trait, jeu parfait
+# Une position sans meilleurs coups ni score est seulement résolue ; --complete ajoute la solution
+# aux lignes qui n'en ont pas (pour ajouter des positions tirées de vraies parties).
+#
+#   python EndgameSuite.py                      # résout endgame_suite.txt avec EndgameSolver
+#   python EndgameSuite.py --ai                 # même suite, coup choisi par AIPlayer
+#   python EndgameSuite.py mes_positions.txt --complete
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+from AIPlayer import AIPlayer, opponent
+from BitBoard import BitBoard
+from EndgameSolver import EndgameSolver
+from GameController import get_weights
+
+SUITE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "endgame_suite.txt")
+SYMBOLS = {'O': 'O', 'X': 'X', '.': '-'}
+
+
+def square_name(move):
+    """(x, y) -> notation colonne-ligne : (2, 3) donne 'd3'"""
+    x, y = move
+    return f"{chr(ord('a') + y)}{x + 1}"
+
+
+def parse_square(name):
+    """Notation colonne-ligne -> (x, y)"""
+    return int(name[1:]) - 1, ord(name[0].lower()) - ord('a')
+
+
+def format_position(board, color, best_moves=None, score=None):
+    """Ligne du fichier pour une position BitBoard"""
+    line = "".join(SYMBOLS[cell] for row in board.grid for cell in row) + " " + color
+    if best_moves is not None:
+        line += " " + ",".join(square_name(move) for move in sorted(best_moves)) + f" {score:+d}"
+    return line
+
+
+def parse_position(line):
+    """
+    Lit une ligne du fichier : retourne (position BitBoard, trait, meilleurs coups ou None, score ou None).
+    Lève ValueError si la ligne est mal formée.
+    """
+    fields = line.split()
+    if len(fields) not in (2, 4):
+        raise ValueError(f"ligne mal formée : {line!r}")
+    cells, color = fields[0], fields[1].upper()
+    size = math.isqrt(len(cells))
+    if size * size != len(cells) or size % 2 or color not in ('O', 'X'):
+        raise ValueError(f"ligne mal formée : {line!r}")
+    o = x = 0
+    for i, cell in enumerate(cells.upper()):
+        if cell == 'O':
+            o |= 1 << i
+        elif cell == 'X':
+            x |= 1 << i
+        elif cell not in '-.':
+            raise ValueError(f"case inconnue {cell!r} : {line!r}")
+    board = BitBoard.decode((size, o, x), get_weights(size))
+    if len(fields) == 2:
+        return board, color, None, None
+    best_moves = {parse_square(name) for name in fields[2].split(",")}
+    return board, color, best_moves, int(fields[3])
+
+
+def load_suite(path=SUITE_PATH):
+    """Positions du fichier, dans l'ordre : liste de (numéro de ligne, position, trait, meilleurs coups, score)"""
+    positions = []
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.split("#", 1)[0].strip()
+            if line:
+                positions.append((number,) + parse_position(line))
+    return positions
+
+
+def solve_all_moves(board, color):
+    """
+    Score exact de chaque coup : retourne (meilleur score, liste de tous les coups qui l'atteignent).
+    Plus cher qu'une résolution simple (pas d'élagage entre les coups), sert à écrire les solutions.
+    """
+    best_score = None
+    best_moves = []
+    for move in board.get_legal_moves(color):
+        child = board.copy()
+        child.make_move(move, color)
+        score = -EndgameSolver(child).solve(opponent(color))[1]
+        if best_score is None or score > best_score:
+            best_score = score
+            best_moves = [move]
+        elif score == best_score:
+            best_moves.append(move)
+    return best_score, best_moves
+
+
+def run_suite(positions, use_ai=False):
+    """
+    Résout chaque position et affiche coup trouvé, score, justesse, nœuds, temps et nœuds/s, puis le total.
+    Retourne le nombre de positions fausses.
+    """
+    print(f"{'ligne':>5} {'vides':>5} {'attendu':>12} {'trouvé':>6} {'score':>5} {'':>4} "
+          f"{'nœuds':>10} {'temps':>8} {'nœuds/s':>9}")
+    total_nodes = 0
+    total_time = 0.0
+    errors = 0
+    for number, board, color, best_moves, expected in positions:
+        empties = board.size * board.size - board.count('O') - board.count('X')
+        start = time.perf_counter()
+        if use_ai:
+            ai = AIPlayer(color, endgame_empties=board.size * board.size)
+            move = ai.search_position(board.copy())
+            score = None
+            nodes = ai.nodes
+        else:
+            solver = EndgameSolver(board)
+            move, score = solver.solve(color)
+            nodes = solver.nodes
+        elapsed = time.perf_counter() - start
+        total_nodes += nodes
+        total_time += elapsed
+        if best_moves is None:
+            verdict = "?"
+            expected_text = "-"
+        else:
+            ok = move in best_moves and (score is None or score == expected)
+            verdict = "ok" if ok else "FAUX"
+            errors += not ok
+            expected_text = f"{','.join(square_name(m) for m in sorted(best_moves))} {expected:+d}"
+        found = square_name(move) if move is not None else "passe"
+        score_text = f"{score:+d}" if score is not None else "-"
+        print(f"{number:>5} {empties:>5} {expected_text:>12} {found:>6} {score_text:>5} {verdict:>4} "
+              f"{nodes:>10} {elapsed:>7.2f}s {nodes / max(elapsed, 1e-9):>9.0f}")
+    print(f"Total : {len(positions) - errors}/{len(positions)} justes, {total_nodes} nœuds en {total_time:.2f}s "
+          f"({total_nodes / max(total_time, 1e-9):.0f} nœuds/s)")
+    return errors
+
+
+def complete_suite(path):
+    """Ajoute meilleurs coups et score aux lignes du fichier qui n'en ont pas (les commentaires sont gardés)"""
+    lines = []
+    with open(path) as f:
+        for line in f:
+            content, _, comment = line.rstrip("\n").partition("#")
+            if content.strip() and len(content.split()) == 2:
+                board, color, _, _ = parse_position(content)
+                score, best_moves = solve_all_moves(board, color)
+                line = format_position(board, color, best_moves, score) + (f"  #{comment}" if comment else "") + "\n"
+            lines.append(line)
+    with open(path, "w") as f:
+        f.writelines(lines)
+
+
+def generate_suite(path=SUITE_PATH, count=12, min_empties=10, max_empties=14, size=8, seed=0):
+    """
+    Écrit une suite de positions tirées de parties aléatoires (graine fixe), résolues par solve_all_moves.
+    Les nombres de cases vides vont de min_empties à max_empties.
+    """
+    rng = random.Random(seed)
+    weights = get_weights(size)
+    lines = [f"# Positions {size}x{size} tirées de parties aléatoires (graine {seed}), résolues par EndgameSolver\n"]
+    while len(lines) <= count:
+        empties = min_empties + (len(lines) - 1) * (max_empties - min_empties + 1) // count
+        board = BitBoard(size, weights)
+        color = 'O'
+        while size * size - board.count('O') - board.count('X') > empties and not board.game_over():
+            moves = board.get_legal_moves(color)
+            if moves:
+                board.make_move(rng.choice(moves), color)
+            color = opponent(color)
+        if size * size - board.count('O') - board.count('X') != empties or not board.get_legal_moves(color):
+            continue
+        score, best_moves = solve_all_moves(board, color)
+        lines.append(format_position(board, color, best_moves, score) + f"  # {empties} vides\n")
+    with open(path, "w") as f:
+        f.writelines(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite de positions de fin de partie")
+    parser.add_argument("path", nargs="?", default=SUITE_PATH, help="fichier de positions (endgame_suite.txt par défaut)")
+    parser.add_argument("--ai", action="store_true", help="coup choisi par AIPlayer plutôt que par EndgameSolver")
+    parser.add_argument("--complete", action="store_true", help="ajouter la solution aux positions qui n'en ont pas")
+    args = parser.parse_args(argv)
+    if args.complete:
+        complete_suite(args.path)
+    return 1 if run_suite(load_suite(args.path), args.ai) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,113 @@
 import tkinter as tk
 from tkinter import font,PhotoImage
 
-from PIL import ImageTk,Image
-
+from AssetCache import load_photo
 from Structures import Move
+from SearchWorker import SearchWorker, PonderWorker
 
 SIZE_BOX = 1
 HEIGHT = 1
+# Taille d'une case en pixels, réduite sur les grands plateaux pour que le plateau tienne dans BOARD_PIXELS
+CELL_PIXELS = 50
+BOARD_PIXELS = 800
+# À partir de cette taille de plateau, le rendu se fait sur un seul Canvas plutôt qu'avec un bouton par case
+CANVAS_MIN_SIZE = 10
+BOARD_COLOR = "#0b2b0c"
+
+
+class ButtonBoardRenderer:
+    """Rendu historique : un tk.Button par case, créés une seule fois"""
+    def __init__(self, board, size, cell, on_click):
+        self.board = board
+        self.cells = {}  # bouton -> case (row, col)
+        self.buttons = []  # case -> bouton : la case (row, col) est self.buttons[row * size + col]
+        for row in range(size):
+            for col in range(size):
+                button = tk.Button(
+                    board, font=("Noto Color Emoji", 36), text="",image=board.transparent,
+                    relief="flat", highlightthickness=1, highlightbackground="black", activebackground="#1a6420",
+                    bg=BOARD_COLOR,width=SIZE_BOX, height=SIZE_BOX, compound="center",
+                )
+                self.cells[button] = (row, col)
+                self.buttons.append(button)
+                button.bind("<ButtonPress-1>", on_click)
+                button.grid(row=row, column=col, padx=0, pady=0, sticky="nsew")
+        for i in range(size):
+            board.grid_rowconfigure(i, weight=0, minsize=cell)
+            board.grid_columnconfigure(i, weight=0, minsize=cell)
+
+    def square_at(self, event):
+        return self.cells.get(event.widget)
+
+    def draw(self, index, disc, marker_color):
+        """Dessine la case 'index' : pion 'O'/'X', sinon marqueur de coup légal de couleur marker_color (ou rien si None)"""
+        button = self.buttons[index]
+        if disc is not None:
+            photo = self.board.player_images[disc]
+            button.config(fg=BOARD_COLOR, image=photo, text="")
+        elif marker_color is not None:
+            photo = self.board.transparent
+            button.config(fg=marker_color, image=photo, text="·")
+        else:
+            photo = self.board.transparent
+            button.config(image=photo, text="")
+        button.image_ref = photo
+
+
+class CanvasBoardRenderer:
+    """
+    Rendu sur un seul tk.Canvas : pour chaque case, un rectangle, une image (pion) et un texte (marqueur)
+    créés une fois pour toutes, que l'on montre, cache ou reconfigure. Les clics sont ramenés à une case
+    par division des coordonnées.
+    """
+    def __init__(self, board, size, cell, on_click):
+        self.board = board
+        self.size = size
+        self.cell = cell
+        self.canvas = tk.Canvas(board, width=size * cell, height=size * cell, bg=BOARD_COLOR,
+                                highlightthickness=0, borderwidth=0)
+        self.images = []
+        self.markers = []
+        marker_font = ("Noto Color Emoji", max(8, 36 * cell // CELL_PIXELS))
+        for row in range(size):
+            for col in range(size):
+                x, y = col * cell, row * cell
+                self.canvas.create_rectangle(x, y, x + cell, y + cell, fill=BOARD_COLOR, outline="black")
+                center = (x + cell // 2, y + cell // 2)
+                self.images.append(self.canvas.create_image(*center, state="hidden"))
+                self.markers.append(self.canvas.create_text(*center, text="·", font=marker_font, state="hidden"))
+        self.canvas.bind("<ButtonPress-1>", on_click)
+        self.canvas.grid(row=0, column=0)
+
+    def square_at(self, event):
+        row, col = event.y // self.cell, event.x // self.cell
+        if 0 <= row < self.size and 0 <= col < self.size:
+            return row, col
+        return None
+
+    def draw(self, index, disc, marker_color):
+        """Dessine la case 'index' : pion 'O'/'X', sinon marqueur de coup légal de couleur marker_color (ou rien si None)"""
+        canvas = self.canvas
+        if disc is not None:
+            canvas.itemconfigure(self.images[index], image=self.board.player_images[disc], state="normal")
+            canvas.itemconfigure(self.markers[index], state="hidden")
+        elif marker_color is not None:
+            canvas.itemconfigure(self.images[index], state="hidden")
+            canvas.itemconfigure(self.markers[index], fill=marker_color, state="normal")
+        else:
+            canvas.itemconfigure(self.images[index], state="hidden")
+            canvas.itemconfigure(self.markers[index], state="hidden")
+
+
+RENDERERS = {"buttons": ButtonBoardRenderer, "canvas": CanvasBoardRenderer}
+
+
 class GameBoardInterface(tk.Frame):
-    def __init__(self, parent, controller):
+    def __init__(self, parent, controller, renderer=None):
+        """
+        renderer : "buttons" (un bouton par case) ou "canvas" (un seul Canvas) ; par défaut,
+        le Canvas est utilisé à partir de CANVAS_MIN_SIZE cases de côté.
+        """
         self.controller = controller
         self.AI = False
         frame = tk.Frame(parent, bg="black", borderwidth=50, relief="solid")  # Bordure noire
@@ -16,79 +115,82 @@ class GameBoardInterface(tk.Frame):
 
         super().__init__(frame)
         self.parent = parent
-        self.cells = {}
-        self.transparent = ImageTk.PhotoImage(Image.open("./layout/transparent.png").resize((50*HEIGHT, 50*HEIGHT)))
+        self.shown = None  # (pions 'O', pions 'X', coups légaux, couleur des marqueurs) affichés
+        self.search = None  # SearchWorker de l'IA en cours de réflexion
+        self.ponder = None  # PonderWorker : réflexion de l'IA pendant le tour du joueur humain
+        self.ponder_enabled = True
+        size = controller.size
+        cell = min(CELL_PIXELS * HEIGHT, BOARD_PIXELS // size)
+        # Images redimensionnées à la taille des cases, lues dans le cache d'AssetCache (PIL seulement au premier lancement)
+        self.transparent = load_photo("./layout/transparent.png", (cell, cell))
         # Préchargement des images des joueurs
         self.player_images = {
-            "X": ImageTk.PhotoImage(Image.open("./layout/jeton_x.png").resize((50*HEIGHT, 50*HEIGHT))),
-            "O": ImageTk.PhotoImage(Image.open("./layout/jeton_o.png").resize((50*HEIGHT, 50*HEIGHT)))
+            "X": load_photo("./layout/jeton_x.png", (cell, cell)),
+            "O": load_photo("./layout/jeton_o.png", (cell, cell))
         }
+        self.legal_moves = []
+        if renderer is None:
+            renderer = "canvas" if size >= CANVAS_MIN_SIZE else "buttons"
+        # Le rendu (boutons ou Canvas) est créé une seule fois : une nouvelle partie ne fait que redessiner les cases
+        self.renderer = RENDERERS[renderer](self, size, cell, self._handle_click)
         self._initialize_gui()
         self.pack(expand=True, fill="both")
-        self.legal_moves = []
 
     def _initialize_gui(self):
-        self.legal_moves = self.controller.get_legal_moves(self.controller.current_color)
-
-        for row in range(self.controller.size):
-            for col in range(self.controller.size):
-                photo = self.player_images.get(self.controller.grid[row][col])
-                button = tk.Button(
-                    self, font=("Noto Color Emoji", 36), text="",image=self.transparent,
-                    relief="flat", highlightthickness=1, highlightbackground="black", activebackground="#1a6420",
-                    bg="#0b2b0c",width=SIZE_BOX, height=SIZE_BOX,
-                )
-                if photo:
-                    print(self.controller.grid[row][col], "coordinates", row, col)
-                    button.config(
-                        fg="#0b2b0c",
-                        image=photo, text="", compound="center",
-                        highlightthickness=1, highlightbackground="black", width=SIZE_BOX, height=SIZE_BOX,
-                    )
-                    button.image_ref = photo
-                if (col,row) in self.legal_moves:
-                    button.config(
-                        fg="#ff2b0c",
-                        image=self.transparent, text="·", compound="center",
-                        highlightthickness=1, highlightbackground="black", width=SIZE_BOX, height=SIZE_BOX,
-                    )
-                    button.image_ref = photo
-                self.cells[button] = (row, col)
-                button.bind("<ButtonPress-1>", self._handle_click)
-                button.grid(row=row, column=col, padx=0, pady=0, sticky="nsew")
-        for i in range(self.controller.size):
-            self.grid_rowconfigure(i, weight=0, minsize=50)
-            self.grid_columnconfigure(i, weight=0, minsize=50)
+        # Rien n'est considéré comme affiché : toutes les cases sont redessinées
+        self.shown = None
+        self.update_board(self.controller.current_color)
 
 
     def update_board(self, color):
+        """
+        Redessine seulement les cases qui ont changé depuis le dernier affichage : pion posé ou retourné,
+        marqueur de coup légal apparu ou disparu (tous les marqueurs si leur couleur change).
+        Les différences sont calculées sur les masques (bit row * size + col) de la position.
+        """
         self.legal_moves = self.controller.get_legal_moves(self.controller.current_color)
         if color == "O":
             colorText = "#ff2b0c"
         else:
             colorText = "#ffffff"
 
-        for button in self.cells.keys():
-            row, col = self.cells[button]
-            photo = self.player_images.get(self.controller.grid[row][col])
-            button.config(
-                fg="#0b2b0c",
-                image=photo, text="", compound="center",
-                highlightthickness=1, highlightbackground="black", width=SIZE_BOX, height=SIZE_BOX,
-            )
-            button.image_ref = photo
-            if (row,col) in self.legal_moves:
-
-                button.config(
-                    fg=colorText,
-                    image=self.transparent, text="·", compound="center",
-                    highlightthickness=1, highlightbackground="black", width=SIZE_BOX, height=SIZE_BOX,
-                )
-                button.image_ref = photo
+        position = self.controller.position
+        _, o, x = position.encode()
+        legal = position.legal_mask(self.controller.current_color)
+        if self.shown is None:
+            changed = (1 << (self.controller.size * self.controller.size)) - 1
+        else:
+            shown_o, shown_x, shown_legal, shown_color = self.shown
+            changed = (o ^ shown_o) | (x ^ shown_x) | (legal ^ shown_legal)
+            if colorText != shown_color:
+                changed |= legal
+        self.shown = (o, x, legal, colorText)
+
+        draw = self.renderer.draw
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            index = bit.bit_length() - 1
+            if o & bit:
+                draw(index, 'O', None)
+            elif x & bit:
+                draw(index, 'X', None)
+            else:
+                draw(index, None, colorText if legal & bit else None)
 
     def _handle_click(self, event):
-        button = event.widget
-        row, col = self.cells[button]
+        # Pendant le tour de l'IA (recherche en cours ou sur le point de démarrer), les clics sont ignorés
+        if self.controller.getCurentPlayer().is_ai:
+            return
+        square = self.renderer.square_at(event)
+        if square is None:
+            return
+        if self.ponder is not None and square in self.controller.get_legal_moves(self.controller.current_color):
+            self._resolve_ponder(square)
+        self._play(square)
+
+    def _play(self, square):
+        row, col = square
         move_with_color = (row, col, self.controller.current_color)
         self.legal_moves = self.controller.get_legal_moves(self.controller.current_color)
         if self.legal_moves == []:
@@ -114,10 +216,11 @@ class GameBoardInterface(tk.Frame):
                 return
         move = move_with_color[:2]
         if move in self.legal_moves:
-            flips = self.controller.make_move(move, self.controller.current_color)
-            self._update_cell(button, move_with_color, flips)
+            self.controller.make_move(move, self.controller.current_color)
 
             if self.controller.game_over():
+                # Partie finie : une réflexion anticipée reprise par ponderhit n'a plus de coup à jouer
+                self.cancel_search()
                 score_black = self.controller.count('O')
                 score_white = self.controller.count('X')
                 if score_black > score_white:
@@ -133,37 +236,71 @@ class GameBoardInterface(tk.Frame):
                 self.after(200, self.ai_move)
             self.update_board(self.controller.current_color)
 
-    def _update_cell(self, button, move, flips):
-        photo = self.player_images.get(move[2])
+    def ai_move(self):
+        """Lance la recherche de l'IA dans un thread ; le coup sera joué par _poll_search"""
+        if self.controller.getCurentPlayer().is_ai and self.search is None:
+            color = self.controller.current_color
+            print(f"{color} réfléchit...")
+            self.search = SearchWorker(self.controller.players_AI[color], self.controller.position.copy()).start()
+            self.after(50, self._poll_search, self.search)
 
-        button.config(
-            fg="#0b2b0c",
-            image=photo, compound="center", text="",
-            highlightthickness=1, highlightbackground="black",width=SIZE_BOX, height=SIZE_BOX
-        )
-        button.image_ref = photo
-        for flip in flips:
-            flip_button = next(b for b, pos in self.cells.items() if pos == flip)
-            flip_button.config(
-                fg="#0b2b0c", image=photo, compound="center", text="",
-                highlightthickness=1, highlightbackground="black",width=SIZE_BOX, height=SIZE_BOX
-            )
-            flip_button.image_ref = photo
+    def _poll_search(self, search):
+        if search is not self.search:
+            return  # recherche annulée (ou remplacée)
+        done, move_pos = search.poll()
+        if not done:
+            self.after(50, self._poll_search, search)
+            return
+        self.search = None
+        if move_pos:
+            row, col = move_pos
+            print(f"{self.controller.current_color} joue {move_pos}.")
+            self._play((row, col))
+            self._start_ponder()
+        elif not self.controller.game_over():
+            # L'IA passe son tour ; une partie finie reste sur le message du vainqueur
+            self.controller.switch_player()
+            self.legal_moves = self.controller.get_legal_moves(self.controller.current_color)
+            self.parent.update_status(f"{self.controller.getCurentPlayer().name}'s Turn", self.controller.players[self.controller.current_color].color)
+            self.ai_move()
 
+    def cancel_search(self):
+        """Annule la réflexion de l'IA en cours (nouvelle partie, changement de joueur IA)"""
+        if self.search is not None:
+            self.search.cancel()
+            self.search = None
+        if self.ponder is not None:
+            self.ponder.cancel()
+            self.ponder = None
 
-    def ai_move(self):
-        if self.controller.getCurentPlayer().is_ai:
-            move_pos = self.controller.make_move_ai()
-            if move_pos:
-                row, col = move_pos
-                move = (row, col, self.controller.current_color)
-                self._handle_click(type('', (), {'widget': next(button for button, pos in self.cells.items() if pos == (row, col))})())
-            else:
-                self.controller.switch_player()
-                self.legal_moves = self.controller.get_legal_moves(self.controller.current_color)
-                self.parent.update_status(f"{self.controller.getCurentPlayer().name}'s Turn", self.controller.players[self.controller.current_color].color)
-                self.ai_move()
+    def set_ponder(self, enabled):
+        self.ponder_enabled = enabled
+        if not enabled and self.ponder is not None:
+            self.ponder.cancel()
+            self.ponder = None
+
+    def _start_ponder(self):
+        """Après un coup de l'IA, si c'est au joueur humain de jouer, l'IA réfléchit déjà à sa réponse"""
+        color = self.controller.current_color
+        ai_color = 'O' if color == 'X' else 'X'
+        if not self.ponder_enabled or self.controller.getCurentPlayer().is_ai or not self.controller.players[ai_color].is_ai:
+            return
+        ai = self.controller.players_AI[ai_color]
+        position = self.controller.position.copy()
+        predicted_move = ai.predict_reply(position)
+        if predicted_move is not None:
+            self.ponder = PonderWorker(ai, position, predicted_move).start()
 
+    def _resolve_ponder(self, move):
+        """Le joueur humain joue 'move' : la réflexion anticipée est reprise si le coup était prévu, sinon abandonnée"""
+        ponder = self.ponder
+        self.ponder = None
+        if move == ponder.predicted_move:
+            ponder.ponderhit()
+            self.search = ponder
+            self.after(50, self._poll_search, ponder)
+        else:
+            ponder.cancel()
 
     def reset_board(self):
         # Reset the board to its initial state
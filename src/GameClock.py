@@ -0,0 +1,42 @@
+import time
+
+
+# Gestion d'une pendule de partie : un budget de temps total réparti sur les coups restants
+class GameClock:
+    def __init__(self, total_time, min_move_time=0.05, safety=0.9):
+        """
+        total_time : temps total (en secondes) dont dispose l'IA pour toute la partie.
+        min_move_time : temps minimum accordé à un coup, même quand la pendule est presque vide.
+        safety : fraction du temps restant réellement distribuée (marge pour l'affichage, le GC...).
+        """
+        self.total_time = total_time
+        self.min_move_time = min_move_time
+        self.safety = safety
+        self.remaining = total_time
+        self._started = None
+
+    def reset(self):
+        """Nouvelle partie : la pendule repart du budget total"""
+        self.remaining = self.total_time
+        self._started = None
+
+    def allocate(self, board):
+        """
+        Temps accordé au prochain coup. Il reste environ une case vide sur deux à jouer pour chaque joueur,
+        on partage donc le temps restant à parts égales entre ces coups.
+        """
+        empties = board.size * board.size - board.count('O') - board.count('X')
+        moves_left = max(1, (empties + 1) // 2)
+        return max(self.min_move_time, self.remaining * self.safety / moves_left)
+
+    def start(self):
+        self._started = time.perf_counter()
+
+    def stop(self):
+        """Décompte le temps écoulé depuis start() et le retourne"""
+        if self._started is None:
+            return 0.0
+        elapsed = time.perf_counter() - self._started
+        self._started = None
+        self.remaining = max(0.0, self.remaining - elapsed)
+        return elapsed
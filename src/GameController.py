@@ -1,7 +1,10 @@
-from AIPlayer import *
-
+import importlib
+import importlib.util
 
-import copy
+from AIPlayer import *
+from BitBoard import BitBoard
+from ListBoard import ListBoard
+from OpeningBook import get_book
 
 
 # Directions pour explorer les 8 directions autour d'une case
@@ -55,36 +58,90 @@ def create_weights(size):
     return weights
 
 
+# Grilles de poids déjà calculées, par taille : immuables (tuples), elles sont partagées
+# par tous les contrôleurs et toutes les positions de même taille
+_WEIGHTS = {}
+
+
+def get_weights(size):
+    """Grille de poids de create_weights sous forme de tuple de tuples, calculée une seule fois par taille"""
+    weights = _WEIGHTS.get(size)
+    if weights is None:
+        weights = _WEIGHTS[size] = tuple(tuple(row) for row in create_weights(size))
+    return weights
+
+
+# Représentations possibles de la position : elles exposent toutes la même interface.
+# Une représentation donnée par un nom de module (classe du même nom) n'est importée qu'à sa première
+# utilisation (get_backend) : importer NumPy coûte plus que tout le reste du démarrage, et seul un
+# GameController(bitboards=False) sur un grand plateau (ou backend="numpy") s'en sert.
+BACKENDS = {"bitboard": BitBoard, "list": ListBoard}
+if importlib.util.find_spec("numpy") is not None:
+    BACKENDS["numpy"] = "NumPyBoard"
+
+
+def get_backend(name):
+    """Classe de la représentation 'name', importée au premier appel si besoin"""
+    backend = BACKENDS[name]
+    if isinstance(backend, str):
+        backend = BACKENDS[name] = getattr(importlib.import_module(backend), backend)
+    return backend
+
+
+# Taille à partir de laquelle le tableau NumPy génère les coups plus vite que le tableau de cases
+# (mesures de NumPyBoard.benchmark ; les bitboards restent devant à toutes les tailles mesurées)
+NUMPY_MIN_SIZE = 16
+
+
+def choose_backend(size, bitboards=True):
+    """
+    Représentation adaptée à un plateau de taille 'size' : les bitboards s'ils sont permis,
+    sinon un tableau de cases, vectorisé par NumPy (s'il est installé) pour les grands plateaux.
+    """
+    if bitboards:
+        return "bitboard"
+    if size >= NUMPY_MIN_SIZE and "numpy" in BACKENDS:
+        return "numpy"
+    return "list"
+
+
 class GameController:
-    def __init__(self, size=8, players=DEFAULT_PLAYERS):
+    def __init__(self, size=8, players=DEFAULT_PLAYERS, backend=None, bitboards=True):
         self.size = size
-        self.weights = create_weights(size)
-        # Initialisation de la grille avec des cases vides représentées par '.'
-        self.grid = [['.' for _ in range(size)] for _ in range(size)]
-        # Position initiale (les 4 pions centraux)
-        mid1 = size // 2 - 1
-        mid2 = size // 2
-        self.grid[mid1][mid1] = 'X'
-        self.grid[mid1][mid2] = 'O'
-        self.grid[mid2][mid1] = 'O'
-        self.grid[mid2][mid2] = 'X'
+        self.weights = get_weights(size)
+        # Sans précision, la représentation est choisie selon la taille par choose_backend (bitboards=False :
+        # tableau de cases, vectorisé par NumPy sur les grands plateaux) ; les 4 pions centraux sont posés par la position
+        self.position = get_backend(backend or choose_backend(size, bitboards))(size, self.weights)
         self.players = players
         self.current_color = 'O'  # Le joueur Noir commence
-        self.players_AI = {"O":AIPlayer('O', max_depth=6),"X": AIPlayer('X', max_depth=6)}
+        # Les IA (et leurs tables de transposition) ne sont créées qu'à la première utilisation
+        self._players_AI = None
+
+    @property
+    def players_AI(self):
+        if self._players_AI is None:
+            # Profondeur, temps et table de transposition adaptés à la taille du plateau (voir board_settings)
+            # et bibliothèque d'ouvertures du plateau si elle existe
+            settings = board_settings(self.size)
+            book = get_book(self.size)
+            self._players_AI = {"O":AIPlayer('O', book=book, **settings),"X": AIPlayer('X', book=book, **settings)}
+        return self._players_AI
+
+    @property
+    def grid(self):
+        """Grille 'X'/'O'/'.' reconstruite depuis les bitboards (lecture seule)"""
+        return self.position.grid
 
     def in_bounds(self, x, y):
         return 0 <= x < self.size and 0 <= y < self.size
 
     def reset_game(self):
         """Réinitialise le plateau de jeu"""
-        self.grid = [['.' for _ in range(self.size)] for _ in range(self.size)]
-        mid1 = self.size // 2 - 1
-        mid2 = self.size // 2
-        self.grid[mid1][mid1] = 'X'
-        self.grid[mid1][mid2] = 'O'
-        self.grid[mid2][mid1] = 'O'
-        self.grid[mid2][mid2] = 'X'
+        self.position.reset()
         self.current_color = 'O'
+        if self._players_AI is not None:
+            for ai in self._players_AI.values():
+                ai.new_game()
 
     def getCurentPlayer(self):
         return self.players[self.current_color]
@@ -95,7 +152,8 @@ class GameController:
 
         # Affichage avec indices
         print("   " + " ".join(f"{i:2}" for i in range(self.size)))
-        for idx, row in enumerate(self.grid):
+        grid = self.grid
+        for idx, row in enumerate(grid):
             print(f"{idx:2} ", end=" ")
             for jdx, cell in enumerate(row):
                 if (idx, jdx) in legal_moves:
@@ -106,63 +164,20 @@ class GameController:
 
     # GameController
     def get_legal_moves(self, color):
-        moves = []
-        for x in range(self.size):
-            for y in range(self.size):
-                if self.is_valid_move(x, y, color):
-                    moves.append((x, y))
-
-        # On retourne la liste des coups triés
-        return moves
+        # Les coups sont retournés dans l'ordre des cases (ligne par ligne)
+        return self.position.get_legal_moves(color)
 
     def count_flips(self, x, y, color):
         """Compte le nombre de pions retournés pour un coup donné (utilisé pour l'affichage)"""
-        flips = 0
-        for dx, dy in DIRECTIONS:
-            nx, ny = x + dx, y + dy
-            count = 0
-            while self.in_bounds(nx, ny) and self.grid[nx][ny] == opponent(color):
-                count += 1
-                nx += dx
-                ny += dy
-            if self.in_bounds(nx, ny) and self.grid[nx][ny] == color:
-                flips += count
-        return flips
+        return self.position.count_flips(x, y, color)
 
     def is_valid_move(self, x, y, color):
-        if self.grid[x][y] != '.':
-            return False
-        for dx, dy in DIRECTIONS:
-            nx, ny = x + dx, y + dy
-            if self.in_bounds(nx, ny) and self.grid[nx][ny] == opponent(color):
-                nx += dx
-                ny += dy
-                while self.in_bounds(nx, ny):
-                    if self.grid[nx][ny] == '.':
-                        break
-                    if self.grid[nx][ny] == color:
-                        return True
-                    nx += dx
-                    ny += dy
-        return False
+        return self.position.is_valid_move(x, y, color)
 
     def make_move(self, move, color):
         """Applique le coup move=(x,y) et retourne la liste des positions retournées pour pouvoir annuler le coup"""
-        x, y = move
-        flips = []
-        self.grid[x][y] = color
-        for dx, dy in DIRECTIONS:
-            nx, ny = x + dx, y + dy
-            potential_flips = []
-            while self.in_bounds(nx, ny) and self.grid[nx][ny] == opponent(color):
-                potential_flips.append((nx, ny))
-                nx += dx
-                ny += dy
-            if self.in_bounds(nx, ny) and self.grid[nx][ny] == color and potential_flips:
-                for fx, fy in potential_flips:
-                    self.grid[fx][fy] = color
-                flips.extend(potential_flips)
-        return flips
+        flips = self.position.make_move(move, color)
+        return self.position.flipped_squares(flips)
 
     def make_move_ai(self):
         """Joue un coup pour l'IA"""
@@ -175,41 +190,31 @@ class GameController:
 
     def toggle_ai(self, player_color):
         self.players[player_color] = self.players[player_color]._replace(is_ai=not self.players[player_color].is_ai)
-        #Si l'adversaire est une ia on passe en mode max_depth=6 sinon max_depth=8
+        #Si l'adversaire est une ia on passe en mode max_depth=6 sinon max_depth=8 (profondeurs du 8x8, adaptées à la taille)
         if self.players[player_color].is_ai:
             if self.players[opponent(player_color)].is_ai:
-                self.players_AI[player_color].max_depth=6
+                self.players_AI[player_color].max_depth=scaled_depth(6, self.size)
             else :
-                self.players_AI[player_color].max_depth=8
+                self.players_AI[player_color].max_depth=scaled_depth(8, self.size)
         #Sinon on passe en mode max_depth=8 pour l'adversaire car je ne suis plus une IA
         else:
             if self.players[opponent(player_color)].is_ai:
-                self.players_AI[opponent(player_color)].max_depth=8
+                self.players_AI[opponent(player_color)].max_depth=scaled_depth(8, self.size)
 
     def undo_move(self, move, flips, color):
         """Annule le coup et restaure les pièces retournées"""
-        x, y = move
-        self.grid[x][y] = '.'
-        for fx, fy in flips:
-            self.grid[fx][fy] = opponent(color)
+        self.position.undo_move(move, self.position.flips_from_squares(flips), color)
 
     def is_full(self):
-        for row in self.grid:
-            if '.' in row:
-                return False
-        return True
+        return self.position.is_full()
 
     def count(self, color):
         """Compte le nombre de pions d'une couleur sur le plateau"""
-        return sum(row.count(color) for row in self.grid)
+        return self.position.count(color)
 
     # Used by AI
     def game_over(self):
-        if self.is_full():
-            return True
-        if not self.get_legal_moves('O') and not self.get_legal_moves('X'):
-            return True
-        return False
+        return self.position.game_over()
 
     def switch_player(self):
         """Change le joueur courant"""
@@ -220,17 +225,24 @@ class GameController:
         Fonction d'évaluation statique basée sur la grille de poids.
         (somme des poids des cases occupées par le joueur - somme des poids des cases occupées par l'adversaire)
         """
-        score = 0
-        for x in range(self.size):
-            for y in range(self.size):
-                if self.grid[x][y] == color:
-                    score += self.weights[x][y]
-                elif self.grid[x][y] == opponent(color):
-                    score -= self.weights[x][y]
-        return score
+        return self.position.evaluate(color)
+
+    def perft(self, depth):
+        """Nombre de feuilles de l'arbre des coups à 'depth' coups de la position courante (voir Perft.py)"""
+        from Perft import perft
+        return perft(self.position, self.current_color, depth)
 
     def clone(self):
-        new_board = GameController(self.size)
-        new_board.grid = copy.deepcopy(self.grid)
+        """
+        Copie de la partie en cours : seule la position (BitBoard) est copiée, les poids sont partagés
+        et les IA du clone ne seront créées que s'il s'en sert. Pour un simple instantané de la position,
+        utiliser directement self.position.copy().
+        """
+        new_board = GameController.__new__(GameController)
+        new_board.size = self.size
         new_board.weights = self.weights
+        new_board.position = self.position.copy()
+        new_board.players = self.players
+        new_board.current_color = self.current_color
+        new_board._players_AI = None
         return new_board
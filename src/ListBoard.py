@@ -0,0 +1,318 @@
+# Représentation du plateau par un tableau de cases à une dimension : la case (x, y) est la case x * size + y.
+# Les rayons partant de chaque case (indices des cases dans chacune des 8 directions, jusqu'au bord)
+# sont précalculés une fois par taille : la génération des coups n'a plus besoin de tester les bords,
+# et les pions retournés sont empilés dans une pile préallouée au lieu de listes construites à chaque direction.
+# Même interface que BitBoard : c'est une alternative pour les tailles où les bitboards sont mal adaptés.
+
+from BitBoard import get_zobrist
+
+EMPTY = 0
+CODES = {'O': 1, 'X': 2}
+SYMBOLS = ('.', 'O', 'X')
+
+# Tables précalculées par taille de plateau (rayons, coordonnées, nombre maximal de pions retournés)
+_RAYS = {}
+
+
+def _build_rays(size):
+    coords = tuple((i // size, i % size) for i in range(size * size))
+    index = {coord: i for i, coord in enumerate(coords)}
+    rays = []
+    for x, y in coords:
+        square_rays = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if dx == 0 and dy == 0:
+                    continue
+                ray = []
+                i, j = x + dx, y + dy
+                while 0 <= i < size and 0 <= j < size:
+                    ray.append(i * size + j)
+                    i += dx
+                    j += dy
+                # Il faut au moins un pion adverse puis un pion du joueur pour retourner quelque chose
+                if len(ray) >= 2:
+                    square_rays.append(tuple(ray))
+        rays.append(tuple(square_rays))
+    # Un coup retourne au plus (longueur - 1) pions par rayon
+    max_flips = max(sum(len(ray) - 1 for ray in square_rays) for square_rays in rays)
+    return tuple(rays), coords, index, max_flips
+
+
+def get_rays(size):
+    rays = _RAYS.get(size)
+    if rays is None:
+        rays = _RAYS[size] = _build_rays(size)
+    return rays
+
+
+class ListBoard:
+    """
+    Position d'Othello sur un tableau de cases (0 vide, 1 'O', 2 'X').
+    Ici make_move retourne le nombre de pions retournés : leurs indices sont sur la pile self._stack,
+    et undo_move les dépile. Les coups doivent donc être annulés dans l'ordre inverse où ils ont été joués,
+    comme le fait la recherche.
+    Le sommet de la pile est self._sp : dépiler ne fait que le redescendre, la liste elle-même sert de tampon
+    et ne grandit (par doublement) que jusqu'à la plus longue suite de coups jouée sans annulation.
+    """
+    __slots__ = ("size", "weights", "flat_weights", "cells", "key", "score", "count_o", "count_x",
+                 "_rays", "_coords", "_index", "_max_flips", "_zobrist", "_stack", "_sp")
+
+    def __init__(self, size=8, weights=None):
+        self.size = size
+        self.weights = weights
+        self.flat_weights = tuple(w for row in weights for w in row) if weights else (0,) * (size * size)
+        self._rays, self._coords, self._index, self._max_flips = get_rays(size)
+        self._zobrist = get_zobrist(size)
+        self._stack = [0] * (size * size)
+        self._sp = 0
+        self.reset()
+
+    def reset(self):
+        """Remet les 4 pions centraux"""
+        size = self.size
+        mid1 = size // 2 - 1
+        mid2 = size // 2
+        self.cells = [EMPTY] * (size * size)
+        self.cells[mid1 * size + mid1] = self.cells[mid2 * size + mid2] = CODES['X']
+        self.cells[mid1 * size + mid2] = self.cells[mid2 * size + mid1] = CODES['O']
+        self._sp = 0
+        self.refresh()
+
+    def refresh(self):
+        """Recalcule à partir de zéro ce que make_move/undo_move tiennent à jour (clé, score, nombre de pions)"""
+        z_o, z_x = self._zobrist[0], self._zobrist[1]
+        weights = self.flat_weights
+        self.key = 0
+        self.score = 0  # somme des poids des pions 'O' - somme des poids des pions 'X'
+        self.count_o = self.count_x = 0
+        for i, cell in enumerate(self.cells):
+            if cell == 1:
+                self.key ^= z_o[i]
+                self.score += weights[i]
+                self.count_o += 1
+            elif cell == 2:
+                self.key ^= z_x[i]
+                self.score -= weights[i]
+                self.count_x += 1
+
+    def hash_key(self, color):
+        """Clé de la position avec le trait à 'color' (mêmes clés de Zobrist que BitBoard)"""
+        if color == 'X':
+            return self.key ^ self._zobrist[3]
+        return self.key
+
+    def copy(self):
+        new_board = ListBoard.__new__(ListBoard)
+        new_board.size = self.size
+        new_board.weights = self.weights
+        new_board.flat_weights = self.flat_weights
+        new_board._rays, new_board._coords = self._rays, self._coords
+        new_board._index, new_board._max_flips = self._index, self._max_flips
+        new_board._zobrist = self._zobrist
+        new_board.cells = self.cells[:]
+        new_board._stack = self._stack[:]
+        new_board._sp = self._sp
+        new_board.key = self.key
+        new_board.score = self.score
+        new_board.count_o = self.count_o
+        new_board.count_x = self.count_x
+        return new_board
+
+    clone = copy
+
+    def encode(self):
+        """Encodage compact (taille, pions 'O', pions 'X') : le même que BitBoard.encode"""
+        o = x = 0
+        for i, cell in enumerate(self.cells):
+            if cell == 1:
+                o |= 1 << i
+            elif cell == 2:
+                x |= 1 << i
+        return self.size, o, x
+
+    @classmethod
+    def decode(cls, encoded, weights=None):
+        size, o, x = encoded
+        board = cls(size, weights)
+        board.cells = [1 if o >> i & 1 else 2 if x >> i & 1 else EMPTY for i in range(size * size)]
+        board.refresh()
+        return board
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.size and 0 <= y < self.size
+
+    @property
+    def grid(self):
+        """Rendu en liste de listes 'X'/'O'/'.' (affichage, interface graphique)"""
+        size = self.size
+        cells = self.cells
+        return [[SYMBOLS[cells[x * size + y]] for y in range(size)] for x in range(size)]
+
+    def _is_legal(self, i, own, opp):
+        """La case vide i permet-elle à 'own' de retourner au moins un pion ?"""
+        cells = self.cells
+        for ray in self._rays[i]:
+            if cells[ray[0]] != opp:
+                continue
+            for j in ray:
+                cell = cells[j]
+                if cell != opp:
+                    break
+            if cell == own:
+                return True
+        return False
+
+    def _legal_indices(self, color):
+        own = CODES[color]
+        opp = 3 - own
+        cells = self.cells
+        is_legal = self._is_legal
+        return [i for i in range(self.size * self.size) if cells[i] == EMPTY and is_legal(i, own, opp)]
+
+    def get_legal_moves(self, color):
+        # Les coups sont retournés dans l'ordre des cases (ligne par ligne), comme avec BitBoard
+        coords = self._coords
+        return [coords[i] for i in self._legal_indices(color)]
+
+    def legal_mask(self, color):
+        """Masque (bit x * size + y) de tous les coups légaux de 'color', comme BitBoard.legal_mask"""
+        mask = 0
+        for i in self._legal_indices(color):
+            mask |= 1 << i
+        return mask
+
+    def is_valid_move(self, x, y, color):
+        i = self._index[(x, y)]
+        if self.cells[i] != EMPTY:
+            return False
+        own = CODES[color]
+        return self._is_legal(i, own, 3 - own)
+
+    def count_flips(self, x, y, color):
+        """Compte le nombre de pions retournés pour un coup donné (utilisé pour l'affichage)"""
+        own = CODES[color]
+        opp = 3 - own
+        cells = self.cells
+        total = 0
+        for ray in self._rays[self._index[(x, y)]]:
+            if cells[ray[0]] != opp:
+                continue
+            n = 0
+            for j in ray:
+                cell = cells[j]
+                if cell != opp:
+                    break
+                n += 1
+            if cell == own:
+                total += n
+        return total
+
+    def make_move(self, move, color):
+        """
+        Applique le coup move=(x,y) et retourne le nombre de pions retournés (empilés sur self._stack).
+        La clé de Zobrist, le score pondéré et le nombre de pions sont mis à jour au passage.
+        """
+        own = CODES[color]
+        opp = 3 - own
+        cells = self.cells
+        stack = self._stack
+        sp = start = self._sp
+        if sp + self._max_flips > len(stack):
+            stack.extend([0] * len(stack))
+        z_flip = self._zobrist[2]
+        weights = self.flat_weights
+        i = self._index[move]
+        key_delta = self._zobrist[0][i] if own == 1 else self._zobrist[1][i]
+        weight = weights[i]
+        for ray in self._rays[i]:
+            if cells[ray[0]] != opp:
+                continue
+            n = 0
+            for j in ray:
+                cell = cells[j]
+                if cell != opp:
+                    break
+                n += 1
+            if cell == own:
+                for k in range(n):
+                    j = ray[k]
+                    cells[j] = own
+                    stack[sp] = j
+                    sp += 1
+                    key_delta ^= z_flip[j]
+                    # Un pion retourné est retiré à l'adversaire et donné au joueur
+                    weight += 2 * weights[j]
+        cells[i] = own
+        flipped = sp - start
+        self._sp = sp
+        self.key ^= key_delta
+        if own == 1:
+            self.score += weight
+            self.count_o += flipped + 1
+            self.count_x -= flipped
+        else:
+            self.score -= weight
+            self.count_x += flipped + 1
+            self.count_o -= flipped
+        return flipped
+
+    def undo_move(self, move, flips, color):
+        """Annule le coup (le dernier joué) en dépilant ses 'flips' pions retournés"""
+        assert flips <= self._sp, "undo_move : coups annulés dans le désordre (pile des retournements vide)"
+        own = CODES[color]
+        opp = 3 - own
+        cells = self.cells
+        stack = self._stack
+        z_flip = self._zobrist[2]
+        weights = self.flat_weights
+        i = self._index[move]
+        key_delta = self._zobrist[0][i] if own == 1 else self._zobrist[1][i]
+        weight = weights[i]
+        sp = self._sp
+        for _ in range(flips):
+            sp -= 1
+            j = stack[sp]
+            cells[j] = opp
+            key_delta ^= z_flip[j]
+            weight += 2 * weights[j]
+        cells[i] = EMPTY
+        self._sp = sp
+        self.key ^= key_delta
+        if own == 1:
+            self.score -= weight
+            self.count_o -= flips + 1
+            self.count_x += flips
+        else:
+            self.score += weight
+            self.count_x -= flips + 1
+            self.count_o += flips
+
+    def flipped_squares(self, flips):
+        """Cases (x, y) des pions retournés par le dernier coup, 'flips' étant la valeur retournée par make_move"""
+        coords = self._coords
+        return [coords[j] for j in self._stack[self._sp - flips:self._sp]]
+
+    def flips_from_squares(self, squares):
+        """Inverse de flipped_squares pour undo_move : les indices sont encore sur la pile"""
+        return len(squares)
+
+    def is_full(self):
+        return self.count_o + self.count_x == self.size * self.size
+
+    def count(self, color):
+        """Compte le nombre de pions d'une couleur sur le plateau"""
+        return self.count_o if color == 'O' else self.count_x
+
+    def game_over(self):
+        """Plateau plein ou aucun des deux joueurs ne peut jouer"""
+        if self.is_full():
+            return True
+        return not self._legal_indices('O') and not self._legal_indices('X')
+
+    def evaluate(self, color):
+        """
+        Fonction d'évaluation statique basée sur la grille de poids.
+        (somme des poids des cases occupées par le joueur - somme des poids des cases occupées par l'adversaire)
+        """
+        return self.score if color == 'O' else -self.score
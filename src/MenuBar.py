@@ -1,5 +1,8 @@
 import tkinter as tk
 
+# Tailles de plateau proposées dans le menu (le rendu par Canvas prend le relais à partir de 10x10)
+BOARD_SIZES = (6, 8, 10, 12, 16, 20)
+
 class MenuBar(tk.Menu):
     def __init__(self, parent, controller):
         super().__init__(parent)
@@ -14,6 +17,17 @@ class MenuBar(tk.Menu):
         game_menu.add_command(label="Play Again", command=self.reset_game)
         game_menu.add_command(label="Toggle WHITE AI", command=lambda: self.toggle_ai("X"))
         game_menu.add_command(label="Toggle RED AI", command=lambda: self.toggle_ai("O"))
+        # Réflexion de l'IA pendant le tour du joueur humain
+        ponder = tk.BooleanVar(value=True)
+        game_menu.add_checkbutton(label="AI Ponder", variable=ponder,
+                                  command=lambda: self.parent.game_board.set_ponder(ponder.get()))
+        # Taille du plateau : nouvelle partie à la taille choisie (voir OthelloApp.change_size)
+        size_menu = tk.Menu(game_menu, tearoff=0)
+        board_size = tk.IntVar(value=controller.size)
+        for size in BOARD_SIZES:
+            size_menu.add_radiobutton(label=f"{size}x{size}", variable=board_size, value=size,
+                                      command=lambda: self.parent.change_size(board_size.get()))
+        game_menu.add_cascade(label="Board Size", menu=size_menu)
         ai_menu.add_cascade(label="Red AI Type", menu=ai_red_menu)
         ai_menu.add_cascade(label="White AI Type", menu=ai_white_menu)
         # Make Minimax the default AI type for the red player
@@ -33,11 +47,13 @@ class MenuBar(tk.Menu):
         parent.config(menu=self)
 
     def reset_game(self):
+        self.parent.game_board.cancel_search()
         self.controller.reset_game()
         self.parent.game_board.reset_board()
         self.parent.update_status("Othello")
 
     def toggle_ai(self, index):
+        self.parent.game_board.cancel_search()
         self.controller.toggle_ai(index)
         if self.controller.getCurentPlayer().is_ai:
             self.parent.update_status(f"{self.controller.getCurentPlayer().name}'s turn")
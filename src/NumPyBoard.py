@@ -0,0 +1,319 @@
+# Représentation du plateau par un tableau NumPy int8 : 0 vide, 1 'O', -1 'X'.
+# Les coups légaux de toutes les cases sont calculés d'un coup par propagation de tableaux décalés
+# dans les 8 directions (comme les décalages de BitBoard, mais sur des tableaux de booléens),
+# de même que les pions retournés par un coup. Intéressant pour les grands plateaux.
+# NumPy est optionnel : GameController n'ajoute ce module à ses représentations que s'il s'importe.
+
+import numpy as np
+
+from BitBoard import get_zobrist
+
+CODES = {'O': 1, 'X': -1}
+# Valeur de la case sentinelle ajoutée après les cases du plateau : ni vide, ni 'O', ni 'X'
+OUTSIDE = 2
+# Indexé par la valeur de la case : -1 donne 'X'
+SYMBOLS = ('.', 'O', 'X')
+
+# Tables de voisinage par taille : sources[k, i] est la case d'où l'on arrive en i en avançant
+# d'un pas dans la direction k (la sentinelle size * size si cette case est hors du plateau) ;
+# steps est la même table en indices du tableau (8, cases) aplati, pour un décalage par un seul t.take(steps)
+_SOURCES = {}
+# Clés de Zobrist sous forme de tableaux uint64, par taille
+_ZOBRIST_ARRAYS = {}
+
+
+def get_sources(size):
+    sources = _SOURCES.get(size)
+    if sources is None:
+        outside = size * size
+        sources = np.full((8, outside + 1), outside, dtype=np.intp)
+        k = 0
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if dx == 0 and dy == 0:
+                    continue
+                for x in range(size):
+                    for y in range(size):
+                        if 0 <= x - dx < size and 0 <= y - dy < size:
+                            sources[k, x * size + y] = (x - dx) * size + (y - dy)
+                k += 1
+        steps = sources + np.arange(8, dtype=np.intp)[:, None] * (outside + 1)
+        sources = _SOURCES[size] = (sources, steps)
+    return sources
+
+
+def get_zobrist_arrays(size):
+    arrays = _ZOBRIST_ARRAYS.get(size)
+    if arrays is None:
+        z_o, z_x, z_flip, z_side = get_zobrist(size)
+        arrays = _ZOBRIST_ARRAYS[size] = (np.array(z_o, dtype=np.uint64), np.array(z_x, dtype=np.uint64),
+                                          np.array(z_flip, dtype=np.uint64), z_side)
+    return arrays
+
+
+def _mask_to_int(mask):
+    """Tableau de booléens -> masque entier (bit x * size + y), comme ceux de BitBoard"""
+    result = 0
+    for i in np.flatnonzero(mask).tolist():
+        result |= 1 << i
+    return result
+
+
+class NumPyBoard:
+    """
+    Position d'Othello sur un tableau NumPy à une dimension (case x * size + y, plus une case sentinelle).
+    Les 8 directions sont traitées ensemble : chaque pas de propagation est un seul take
+    sur un tableau (8, cases). Même interface que BitBoard ; ici make_move retourne le tableau de booléens
+    des pions retournés, que undo_move sait annuler.
+    """
+    __slots__ = ("size", "weights", "flat_weights", "cells", "key", "score", "count_o", "count_x",
+                 "_weights_array", "_sources", "_steps", "_zobrist", "_zobrist_arrays")
+
+    def __init__(self, size=8, weights=None):
+        self.size = size
+        self.weights = weights
+        self.flat_weights = tuple(w for row in weights for w in row) if weights else (0,) * (size * size)
+        self._weights_array = np.array(self.flat_weights, dtype=np.int64)
+        self._sources, self._steps = get_sources(size)
+        self._zobrist = get_zobrist(size)
+        self._zobrist_arrays = get_zobrist_arrays(size)
+        self.reset()
+
+    def reset(self):
+        """Remet les 4 pions centraux"""
+        size = self.size
+        mid1 = size // 2 - 1
+        mid2 = size // 2
+        self.cells = np.zeros(size * size + 1, dtype=np.int8)
+        self.cells[-1] = OUTSIDE
+        self.cells[mid1 * size + mid1] = self.cells[mid2 * size + mid2] = CODES['X']
+        self.cells[mid1 * size + mid2] = self.cells[mid2 * size + mid1] = CODES['O']
+        self.refresh()
+
+    def refresh(self):
+        """Recalcule à partir de zéro ce que make_move/undo_move tiennent à jour (clé, score, nombre de pions)"""
+        o = self.cells[:-1] == 1
+        x = self.cells[:-1] == -1
+        z_o, z_x = self._zobrist_arrays[0], self._zobrist_arrays[1]
+        self.key = int(np.bitwise_xor.reduce(z_o[o])) ^ int(np.bitwise_xor.reduce(z_x[x]))
+        # somme des poids des pions 'O' - somme des poids des pions 'X'
+        self.score = int(self._weights_array[o].sum()) - int(self._weights_array[x].sum())
+        self.count_o = int(o.sum())
+        self.count_x = int(x.sum())
+
+    def hash_key(self, color):
+        """Clé de la position avec le trait à 'color' (mêmes clés de Zobrist que BitBoard)"""
+        if color == 'X':
+            return self.key ^ self._zobrist[3]
+        return self.key
+
+    def copy(self):
+        new_board = NumPyBoard.__new__(NumPyBoard)
+        new_board.size = self.size
+        new_board.weights = self.weights
+        new_board.flat_weights = self.flat_weights
+        new_board._weights_array = self._weights_array
+        new_board._sources, new_board._steps = self._sources, self._steps
+        new_board._zobrist = self._zobrist
+        new_board._zobrist_arrays = self._zobrist_arrays
+        new_board.cells = self.cells.copy()
+        new_board.key = self.key
+        new_board.score = self.score
+        new_board.count_o = self.count_o
+        new_board.count_x = self.count_x
+        return new_board
+
+    clone = copy
+
+    def encode(self):
+        """Encodage compact (taille, pions 'O', pions 'X') : le même que BitBoard.encode"""
+        return self.size, _mask_to_int(self.cells == 1), _mask_to_int(self.cells == -1)
+
+    @classmethod
+    def decode(cls, encoded, weights=None):
+        size, o, x = encoded
+        board = cls(size, weights)
+        board.cells[:-1] = [1 if o >> i & 1 else -1 if x >> i & 1 else 0 for i in range(size * size)]
+        board.refresh()
+        return board
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.size and 0 <= y < self.size
+
+    @property
+    def grid(self):
+        """Rendu en liste de listes 'X'/'O'/'.' (affichage, interface graphique)"""
+        size = self.size
+        cells = self.cells.tolist()
+        return [[SYMBOLS[cell] for cell in cells[x * size:(x + 1) * size]] for x in range(size)]
+
+    def legal_array(self, color):
+        """Tableau de booléens (une case par élément) des coups légaux de 'color', pour toutes les cases à la fois"""
+        code = CODES[color]
+        cells = self.cells
+        steps = self._steps
+        opp = cells == -code
+        # t[k] : pions adverses atteints depuis un pion du joueur en avançant dans la direction k
+        t = (cells == code)[self._sources] & opp
+        # reached[k] : cases atteintes juste après une ligne de pions adverses
+        reached = np.zeros_like(t)
+        while t.any():
+            step = t.take(steps)
+            reached |= step
+            t = step & opp
+        # Un coup si la première case non adverse après la ligne est vide
+        return (reached & (cells == 0)).any(axis=0)[:-1]
+
+    def flips_array(self, move, color):
+        """Tableau de booléens des pions retournés si 'color' joue en move=(x,y)"""
+        code = CODES[color]
+        cells = self.cells
+        steps = self._steps
+        own = cells == code
+        opp = cells == -code
+        start = np.zeros_like(own)
+        start[move[0] * self.size + move[1]] = True
+        # Une ligne par direction : pions adverses alignés depuis la case jouée
+        t = start[self._sources] & opp
+        lines = np.zeros_like(t)
+        closed = np.zeros(8, dtype=bool)
+        while t.any():
+            lines |= t
+            step = t.take(steps)
+            # La ligne se termine sur un pion du joueur : ses pions sont retournés
+            closed |= (step & own).any(axis=1)
+            t = step & opp
+        return lines[closed].any(axis=0)[:-1]
+
+    def get_legal_moves(self, color):
+        # Les coups sont retournés dans l'ordre des cases (ligne par ligne), comme avec BitBoard
+        return [divmod(i, self.size) for i in np.flatnonzero(self.legal_array(color)).tolist()]
+
+    def legal_mask(self, color):
+        """Masque entier (bit x * size + y) de tous les coups légaux de 'color', comme BitBoard.legal_mask"""
+        return _mask_to_int(self.legal_array(color))
+
+    def is_valid_move(self, x, y, color):
+        if self.cells[x * self.size + y] != 0:
+            return False
+        return bool(self.flips_array((x, y), color).any())
+
+    def count_flips(self, x, y, color):
+        """Compte le nombre de pions retournés pour un coup donné (utilisé pour l'affichage)"""
+        return int(self.flips_array((x, y), color).sum())
+
+    def make_move(self, move, color):
+        """
+        Applique le coup move=(x,y) et retourne le tableau des pions retournés pour pouvoir annuler le coup.
+        La clé de Zobrist, le score pondéré et le nombre de pions sont mis à jour au passage.
+        """
+        flips = self.flips_array(move, color)
+        code = CODES[color]
+        self.cells[:-1][flips] = code
+        self.cells[move[0] * self.size + move[1]] = code
+        self._apply_delta(move, flips, color, 1)
+        return flips
+
+    def undo_move(self, move, flips, color):
+        """Annule le coup et restaure les pièces retournées"""
+        self.cells[:-1][flips] = -CODES[color]
+        self.cells[move[0] * self.size + move[1]] = 0
+        self._apply_delta(move, flips, color, -1)
+
+    def _apply_delta(self, move, flips, color, sign):
+        """Met à jour clé, score et nombre de pions (sign=1 pour jouer le coup, -1 pour l'annuler)"""
+        z_o, z_x, z_flip = self._zobrist_arrays[0], self._zobrist_arrays[1], self._zobrist_arrays[2]
+        index = move[0] * self.size + move[1]
+        key_delta = int(z_o[index] if color == 'O' else z_x[index])
+        key_delta ^= int(np.bitwise_xor.reduce(z_flip[flips]))
+        # Un pion retourné est retiré à l'adversaire et donné au joueur
+        weight = self.flat_weights[index] + 2 * int(self._weights_array[flips].sum())
+        flipped = int(flips.sum())
+        self.key ^= key_delta
+        if color == 'O':
+            self.score += sign * weight
+            self.count_o += sign * (flipped + 1)
+            self.count_x -= sign * flipped
+        else:
+            self.score -= sign * weight
+            self.count_x += sign * (flipped + 1)
+            self.count_o -= sign * flipped
+
+    def flipped_squares(self, flips):
+        """Cases (x, y) des pions retournés, 'flips' étant le tableau retourné par make_move"""
+        return [divmod(i, self.size) for i in np.flatnonzero(flips).tolist()]
+
+    def flips_from_squares(self, squares):
+        """Inverse de flipped_squares : tableau à passer à undo_move"""
+        flips = np.zeros(self.size * self.size, dtype=bool)
+        for x, y in squares:
+            flips[x * self.size + y] = True
+        return flips
+
+    def is_full(self):
+        return self.count_o + self.count_x == self.size * self.size
+
+    def count(self, color):
+        """Compte le nombre de pions d'une couleur sur le plateau"""
+        return self.count_o if color == 'O' else self.count_x
+
+    def game_over(self):
+        """Plateau plein ou aucun des deux joueurs ne peut jouer"""
+        if self.is_full():
+            return True
+        return not self.legal_array('O').any() and not self.legal_array('X').any()
+
+    def evaluate(self, color):
+        """
+        Fonction d'évaluation statique basée sur la grille de poids.
+        (somme des poids des cases occupées par le joueur - somme des poids des cases occupées par l'adversaire)
+        """
+        return self.score if color == 'O' else -self.score
+
+def benchmark(sizes=(8, 12, 16, 20), positions=20, repeat=50, seed=0):
+    """
+    Compare les représentations de la position sur des positions de milieu de partie (tirées au hasard) :
+    génération des coups légaux (sans le cache des coups de BitBoard) puis coup joué et annulé.
+    """
+    import random
+    import time
+    from BitBoard import BitBoard
+    from GameController import get_weights
+    from ListBoard import ListBoard
+
+    print(f"{'taille':>6} {'représentation':>14} {'coups légaux':>14} {'jouer/annuler':>14}")
+    for size in sizes:
+        rng = random.Random(seed)
+        weights = get_weights(size)
+        samples = []
+        while len(samples) < positions:
+            board = BitBoard(size, weights)
+            color = 'O'
+            for _ in range(rng.randrange(size * size // 4, size * size // 2)):
+                moves = board.get_legal_moves(color)
+                if moves:
+                    board.make_move(rng.choice(moves), color)
+                color = 'X' if color == 'O' else 'O'
+            if board.get_legal_moves(color):
+                samples.append((board.encode(), color))
+        for cls in (BitBoard, ListBoard, NumPyBoard):
+            boards = [(cls.decode(encoded, weights), color) for encoded, color in samples]
+            first_moves = [board.get_legal_moves(color)[0] for board, color in boards]
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for board, color in boards:
+                    if cls is BitBoard:
+                        board._moves_cache.clear()
+                    board.get_legal_moves(color)
+            legal_time = (time.perf_counter() - start) / (repeat * positions)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for (board, color), move in zip(boards, first_moves):
+                    flips = board.make_move(move, color)
+                    board.undo_move(move, flips, color)
+            move_time = (time.perf_counter() - start) / (repeat * positions)
+            print(f"{size:>6} {cls.__name__:>14} {legal_time * 1e6:>12.0f}µs {move_time * 1e6:>12.0f}µs")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,216 @@
+# Bibliothèque d'ouvertures : meilleur coup et score de positions d'ouverture calculés une fois pour toutes
+# par une recherche profonde, pour que l'IA ne refasse pas à chaque partie la même recherche depuis
+# les mêmes positions.
+#
+# Fichier binaire (petit-boutiste) :
+#   en-tête : 'OTHBOOK2', taille du plateau (H), profondeur de recherche (H), 4 octets nuls
+#   entrées : clé de Zobrist de la forme canonique de la position (Symmetry.py), trait compris (Q),
+#             case du coup dans le repère canonique x * size + y (h), score (i)
+# Les 8 orientations d'une position partagent ainsi une seule entrée.
+# Les entrées sont triées par clé : le fichier est ouvert avec mmap et une position est cherchée par
+# dichotomie, sans rien charger en mémoire (quelques lectures de 8 octets par recherche).
+# Le score est celui de la recherche, du point de vue du joueur qui a le trait.
+#
+#   python OpeningBook.py                               # construit opening_book_8x8.bin
+#   python OpeningBook.py --plies 4 --depth 10 --games 50 --game-plies 14
+#   python OpeningBook.py --size 6 --show
+
+import argparse
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+
+from Symmetry import canonical_key, inverse_square, transform_square
+
+MAGIC = b"OTHBOOK2"
+HEADER = struct.Struct("<8sHH4x")
+RECORD = struct.Struct("<Qhi")
+KEY = struct.Struct("<Q")
+BOOK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Bibliothèques déjà ouvertes par get_book, par taille de plateau (None si le fichier n'existe pas)
+_BOOKS = {}
+
+
+def book_path(size):
+    """Fichier de la bibliothèque d'un plateau size x size"""
+    return os.path.join(BOOK_DIR, f"opening_book_{size}x{size}.bin")
+
+
+class OpeningBook:
+    """Bibliothèque en lecture seule, projetée en mémoire (mmap)"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            raise ValueError(f"{path} : fichier trop court pour une bibliothèque d'ouvertures")
+        magic, self.size, self.depth = HEADER.unpack_from(self.data)
+        if magic != MAGIC or (len(self.data) - HEADER.size) % RECORD.size:
+            raise ValueError(f"{path} : ce n'est pas une bibliothèque d'ouvertures")
+        self.path = path
+        self.entries = (len(self.data) - HEADER.size) // RECORD.size
+
+    def __len__(self):
+        return self.entries
+
+    def close(self):
+        self.data.close()
+
+    def probe(self, key):
+        """(case du coup, score) de la position de clé 'key', ou None : dichotomie sur les clés du fichier"""
+        data = self.data
+        lo, hi = 0, self.entries
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if KEY.unpack_from(data, HEADER.size + mid * RECORD.size)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.entries:
+            stored, square, score = RECORD.unpack_from(data, HEADER.size + lo * RECORD.size)
+            if stored == key:
+                return square, score
+        return None
+
+    def lookup(self, board, color):
+        """(coup (x, y), score) pour la position 'board' avec le trait à 'color', ou None si elle n'y est pas"""
+        if board.size != self.size:
+            return None
+        key, t = canonical_key(board, color)
+        entry = self.probe(key)
+        if entry is None:
+            return None
+        return inverse_square(divmod(entry[0], self.size), t, self.size), entry[1]
+
+    def items(self):
+        """Toutes les entrées (clé, case du coup dans le repère canonique, score), dans l'ordre du fichier"""
+        for i in range(self.entries):
+            yield RECORD.unpack_from(self.data, HEADER.size + i * RECORD.size)
+
+
+def get_book(size):
+    """Bibliothèque par défaut du plateau size x size (ouverte une seule fois), ou None s'il n'y en a pas"""
+    if size not in _BOOKS:
+        path = book_path(size)
+        _BOOKS[size] = OpeningBook(path) if os.path.exists(path) else None
+    return _BOOKS[size]
+
+
+def write_book(path, size, depth, entries):
+    """
+    Écrit une bibliothèque : entries associe une clé canonique à (case du coup dans le repère canonique, score).
+    Le fichier est écrit à côté puis renommé, pour qu'un processus qui le lit ne voie jamais un fichier partiel.
+    """
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(HEADER.pack(MAGIC, size, depth))
+        for key in sorted(entries):
+            square, score = entries[key]
+            f.write(RECORD.pack(key, square, score))
+    os.replace(temporary, path)
+    _BOOKS.pop(size, None)
+
+
+def build_book(size=8, depth=8, plies=5, games=0, game_plies=12, seed=0, progress=None):
+    """
+    Calcule les entrées d'une bibliothèque (clé canonique -> (case du coup, score)) par des recherches
+    à profondeur 'depth', une seule par classe de positions symétriques :
+      - toutes les positions à moins de 'plies' coups de la position de départ ;
+      - puis 'games' parties d'auto-apprentissage : les 'plies' premiers coups sont tirés au hasard (graine 'seed'),
+        ensuite chaque camp joue le coup de la bibliothèque (calculé au besoin) jusqu'au coup 'game_plies'.
+    progress(nombre d'entrées) est appelé après chaque position calculée.
+    """
+    from AIPlayer import AIPlayer, opponent, order_moves
+    from BitBoard import BitBoard
+    from GameController import get_weights
+
+    entries = {}
+    # Une IA par couleur : leurs tables de transposition servent d'une position à la suivante
+    players = {color: AIPlayer(color, max_depth=depth, endgame_empties=None, wld_empties=None) for color in 'OX'}
+
+    def book_move(board, color):
+        key, t = canonical_key(board, color)
+        if key not in entries:
+            ai = players[color]
+            ai.ordering.new_search()
+            legal_moves = order_moves(board, board.get_legal_moves(color), color)
+            move, value, _ = ai.search_root(board, legal_moves, depth, {})
+            x, y = transform_square(move, t, size)
+            entries[key] = (x * size + y, value)
+            if progress is not None:
+                progress(len(entries))
+        return inverse_square(divmod(entries[key][0], size), t, size)
+
+    def play(board, color, move):
+        board.make_move(move, color)
+        color = opponent(color)
+        if not board.get_legal_moves(color):
+            color = opponent(color)  # passe
+        return color
+
+    # Arbre complet des premiers coups, en largeur
+    level = [(BitBoard(size, get_weights(size)), 'O')]
+    for ply in range(plies):
+        next_level = {}
+        for board, color in level:
+            moves = board.get_legal_moves(color)
+            if not moves:
+                continue
+            book_move(board, color)
+            if ply + 1 < plies:
+                for move in moves:
+                    child = board.copy()
+                    child_color = play(child, color, move)
+                    next_level[canonical_key(child, child_color)[0]] = (child, child_color)
+        level = list(next_level.values())
+
+    rng = random.Random(seed)
+    for _ in range(games):
+        board = BitBoard(size, get_weights(size))
+        color = 'O'
+        for ply in range(game_plies):
+            moves = board.get_legal_moves(color)
+            if not moves:
+                break
+            move = rng.choice(moves) if ply < plies else book_move(board, color)
+            color = play(board, color, move)
+    return entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Construction de la bibliothèque d'ouvertures")
+    parser.add_argument("--size", type=int, default=8, help="taille du plateau (8 par défaut)")
+    parser.add_argument("--depth", type=int, default=8, help="profondeur des recherches (8 par défaut)")
+    parser.add_argument("--plies", type=int, default=5, help="toutes les positions à moins de PLIES coups (5 par défaut)")
+    parser.add_argument("--games", type=int, default=0, help="parties d'auto-apprentissage (0 par défaut)")
+    parser.add_argument("--game-plies", type=int, default=12, help="longueur des parties d'auto-apprentissage")
+    parser.add_argument("--seed", type=int, default=0, help="graine des ouvertures aléatoires")
+    parser.add_argument("--output", help="fichier à écrire (opening_book_<taille>x<taille>.bin par défaut)")
+    parser.add_argument("--show", action="store_true", help="afficher la bibliothèque existante sans la reconstruire")
+    args = parser.parse_args(argv)
+    path = args.output or book_path(args.size)
+
+    if args.show:
+        book = OpeningBook(path)
+        print(f"{path} : {len(book)} positions {book.size}x{book.size}, profondeur {book.depth}")
+        for key, square, score in book.items():
+            print(f"{key:016x} {divmod(square, book.size)} {score:+d}")
+        return 0
+
+    start = time.perf_counter()
+
+    def progress(count):
+        print(f"\r{count} positions ({time.perf_counter() - start:.0f}s)", end="", flush=True)
+
+    entries = build_book(args.size, args.depth, args.plies, args.games, args.game_plies, args.seed, progress)
+    write_book(path, args.size, args.depth, entries)
+    print(f"\n{len(entries)} positions écrites dans {path} en {time.perf_counter() - start:.0f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+import multiprocessing
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+from AIPlayer import AIPlayer, SearchTimeout, opponent
+from BitBoard import BitBoard
+from GameController import get_weights
+from SharedTranspositionTable import SharedTranspositionTable
+
+# Valeur du alpha partagé tant qu'aucun coup de la racine n'a été évalué
+NO_ALPHA = -(1 << 30)
+
+# État propre à chaque processus de calcul (initialisé par _init_worker)
+_worker_alpha = None
+_worker_tt_size_mb = 8
+_worker_tt = None
+_worker_players = {}
+
+
+def _init_worker(alpha, tt_size_mb, shared_tt_name):
+    global _worker_alpha, _worker_tt_size_mb, _worker_tt
+    _worker_alpha = alpha
+    _worker_tt_size_mb = tt_size_mb
+    if shared_tt_name is not None:
+        _worker_tt = SharedTranspositionTable(name=shared_tt_name)
+
+
+def _worker_board(encoded):
+    return BitBoard.decode(encoded, get_weights(encoded[0]))
+
+
+def _worker_player(color):
+    # Un AIPlayer par couleur et par processus : sa table de transposition (partagée avec les autres
+    # processus si elle existe) sert d'un coup à l'autre
+    player = _worker_players.get(color)
+    if player is None:
+        player = _worker_players[color] = AIPlayer(color, tt_size_mb=_worker_tt_size_mb, tt=_worker_tt)
+    return player
+
+
+def _search_move(encoded, color, move, depth, guess, time_left):
+    """
+    Évalue un coup de la racine dans un processus de calcul.
+    Si un meilleur coup est déjà connu (alpha partagé), on commence par un test à fenêtre nulle :
+    un coup qui ne le bat pas n'a pas besoin de valeur exacte.
+    L'alpha partagé n'est lu qu'une fois, au début de la tâche : un frère qui l'améliore pendant ce temps
+    ne resserre pas une recherche déjà commencée, seulement celles des coups qui partent ensuite.
+    Retourne (coup, valeur, exacte) ; valeur vaut None si l'heure limite a été atteinte.
+    """
+    board = _worker_board(encoded)
+    ai = _worker_player(color)
+    ai.deadline = time.perf_counter() + time_left if time_left is not None else None
+    board.make_move(move, color)
+    try:
+        alpha = _worker_alpha.value
+        if alpha > NO_ALPHA:
+            value = -ai.nega_max(board, depth - 1, -alpha - 1, -alpha, opponent(color))
+            if value <= alpha:
+                return move, value, False
+        value = -ai.mtdf(board, depth - 1, -guess, opponent(color))
+    except SearchTimeout:
+        return move, None, False
+    finally:
+        ai.deadline = None
+    with _worker_alpha.get_lock():
+        if value > _worker_alpha.value:
+            _worker_alpha.value = value
+    return move, value, True
+
+
+# IA qui répartit les coups de la racine sur plusieurs processus.
+# Le premier coup (le plus prometteur) est calculé seul pour fixer alpha (« Young Brothers Wait »),
+# puis ses frères sont évalués en parallèle en partageant le meilleur alpha connu.
+# Par défaut, tous les processus (y compris celui-ci) utilisent la même table de transposition
+# en mémoire partagée, allouée une fois pour toutes à la construction.
+class ParallelAIPlayer(AIPlayer):
+    def __init__(self, color, max_depth=4, tt_size_mb=8, time_limit=None, clock=None, workers=None,
+                 shared_tt=True):
+        tt = SharedTranspositionTable(tt_size_mb) if shared_tt else None
+        super().__init__(color, max_depth, tt_size_mb, time_limit, clock, tt)
+        self.workers = workers or multiprocessing.cpu_count()
+        self.tt_size_mb = tt_size_mb
+        self.shared_tt = shared_tt
+        self.executor = None
+        self.shared_alpha = None
+
+    def _get_executor(self):
+        if self.executor is None:
+            self.shared_alpha = multiprocessing.Value('i', NO_ALPHA)
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker,
+                initargs=(self.shared_alpha, self.tt_size_mb, self.tt.name if self.shared_tt else None))
+            # Les processus sont arrêtés même sans close() explicite (la table partagée a son propre finaliseur)
+            self._finalizer = weakref.finalize(self, self.executor.shutdown, cancel_futures=True)
+        return self.executor
+
+    def close(self):
+        """Arrête les processus de calcul et libère la table partagée"""
+        if self.executor is not None:
+            self._finalizer()
+            self.executor = None
+        if self.shared_tt:
+            self.tt.close()
+            self.shared_tt = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def search_root(self, board, legal_moves, depth, guesses):
+        # Sur un petit arbre, le coût de communication dépasse le gain
+        if depth <= 2 or len(legal_moves) < 2 or self.workers < 2:
+            return super().search_root(board, legal_moves, depth, guesses)
+
+        executor = self._get_executor()
+        first = legal_moves[0]
+        flips = board.make_move(first, self.color)
+        best_value = -self.mtdf(board, depth - 1, -guesses.get(first, 0), opponent(self.color))
+        board.undo_move(first, flips, self.color)
+        best_move = first
+        values = {first: best_value}
+        self.shared_alpha.value = best_value
+
+        encoded = board.encode()
+        time_left = self.deadline - time.perf_counter() if self.deadline is not None else None
+        futures = [executor.submit(_search_move, encoded, self.color, move, depth,
+                                   guesses.get(move, best_value), time_left)
+                   for move in legal_moves[1:]]
+        timed_out = False
+        exact_values = {}
+        for future in futures:
+            move, value, exact = future.result()
+            if value is None:
+                timed_out = True
+                continue
+            values[move] = value
+            if exact:
+                exact_values[move] = value
+        if timed_out:
+            raise SearchTimeout()
+        # Même départage que la recherche séquentielle : à valeur égale, le premier coup dans l'ordre
+        for move in legal_moves[1:]:
+            if move in exact_values and exact_values[move] > best_value:
+                best_value = exact_values[move]
+                best_move = move
+        return best_move, best_value, values
+
+
+def benchmark(depth=6, positions=6, workers=None, seed=0, shared_tt=True):
+    """
+    Compare le temps de choose_move séquentiel et parallèle à même profondeur. Les deux font la même recherche
+    à la racine (premier coup par mtd(f), frères par test à fenêtre nulle) : l'écart ne vient que de la
+    répartition des frères sur les processus.
+    """
+    import random
+    from GameController import GameController
+
+    rng = random.Random(seed)
+    boards = []
+    while len(boards) < positions:
+        board = GameController()
+        color = 'O'
+        for _ in range(rng.randint(6, 30)):
+            moves = board.get_legal_moves(color)
+            if moves:
+                board.make_move(rng.choice(moves), color)
+            color = opponent(color)
+        if board.get_legal_moves(color):
+            boards.append((board, color))
+
+    serial_time = parallel_time = 0.0
+    same = 0
+    for board, color in boards:
+        serial = AIPlayer(color, max_depth=depth)
+        parallel = ParallelAIPlayer(color, max_depth=depth, workers=workers, shared_tt=shared_tt)
+        parallel._get_executor()  # le démarrage des processus n'est pas compté
+        # Les deux recherches partent d'un cache des coups vide : sinon la seconde profiterait des coups
+        # déjà générés par la première (le cache est commun à toutes les positions du processus)
+        board.position._moves_cache.clear()
+        start = time.perf_counter()
+        serial_move = serial.choose_move(board)
+        serial_time += time.perf_counter() - start
+        board.position._moves_cache.clear()
+        start = time.perf_counter()
+        parallel_move = parallel.choose_move(board)
+        parallel_time += time.perf_counter() - start
+        parallel.close()
+        same += serial_move == parallel_move
+    print(f"profondeur {depth}, {positions} positions, {parallel.workers} processus, "
+          f"table {'partagée' if shared_tt else 'privée'}")
+    print(f"séquentiel : {serial_time:.2f}s  parallèle : {parallel_time:.2f}s  "
+          f"accélération : x{serial_time / parallel_time:.2f}  (même coup : {same}/{positions})")
+
+
+if __name__ == "__main__":
+    benchmark(shared_tt=False)
+    benchmark(shared_tt=True)
@@ -0,0 +1,80 @@
+# Perft : nombre de feuilles de l'arbre des coups à une profondeur donnée depuis la position de départ.
+# Conventions (celles des comptes de référence publiés pour le 8x8) : un passe compte comme un coup,
+# et une partie terminée avant la profondeur demandée compte comme une feuille.
+# Le compte ne dépend que de la génération des coups et de make_move/undo_move : il valide une
+# réécriture de ces fonctions, et le débit mesuré ne dépend pas de la recherche de l'IA.
+#
+#   python Perft.py 7                          # 8x8 jusqu'à la profondeur 7
+#   python Perft.py 6 --size 6 --backend list
+
+import argparse
+import sys
+import time
+
+from AIPlayer import opponent
+from GameController import BACKENDS, GameController
+
+# Comptes de référence depuis la position de départ, index = profondeur (le 8x8 est le compte publié ;
+# les autres tailles sont nos propres comptes, identiques avec les représentations bitboard et liste
+# et avec l'ancien moteur de testDeGrilleSansInterface.py)
+PERFT_COUNTS = {
+    4: (1, 4, 12, 44, 128, 424, 1256, 3624, 9116, 20044, 36540, 50704, 57436, 59564, 59980),
+    6: (1, 4, 12, 56, 244, 1364, 7604, 47740, 308716, 2114912),
+    8: (1, 4, 12, 56, 244, 1396, 8200, 55092, 390216, 3005288, 24571284),
+    10: (1, 4, 12, 56, 244, 1396, 8200, 55180, 392268),
+}
+
+
+def perft(position, color, depth, passed=False):
+    """Nombre de feuilles à 'depth' coups de la position (qui est rendue inchangée), avec le trait à 'color'"""
+    if depth == 0:
+        return 1
+    moves = position.get_legal_moves(color)
+    if not moves:
+        if passed:
+            # Aucun des deux joueurs ne peut jouer : partie terminée, c'est une feuille
+            return 1
+        return perft(position, opponent(color), depth - 1, True)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        flips = position.make_move(move, color)
+        nodes += perft(position, opponent(color), depth - 1)
+        position.undo_move(move, flips, color)
+    return nodes
+
+
+def run(max_depth, size=8, backend=None):
+    """Perft de 1 à max_depth depuis la position de départ ; retourne True si tous les comptes connus sont justes"""
+    board = GameController(size, backend=backend)
+    references = PERFT_COUNTS.get(size, ())
+    ok = True
+    print(f"Perft {size}x{size} ({type(board.position).__name__})")
+    print(f"{'profondeur':>10} {'feuilles':>12} {'temps':>8} {'nœuds/s':>10}")
+    for depth in range(1, max_depth + 1):
+        start = time.perf_counter()
+        nodes = board.perft(depth)
+        elapsed = time.perf_counter() - start
+        line = f"{depth:>10} {nodes:>12} {elapsed:>7.2f}s {nodes / max(elapsed, 1e-9):>10.0f}"
+        if depth < len(references):
+            if nodes == references[depth]:
+                line += "  ok"
+            else:
+                line += f"  ERREUR (attendu {references[depth]})"
+                ok = False
+        print(line)
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perft : comptage des feuilles de l'arbre des coups")
+    parser.add_argument("depth", type=int, nargs="?", default=7, help="profondeur maximale (7 par défaut)")
+    parser.add_argument("--size", type=int, default=8, help="taille du plateau (8 par défaut)")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), help="représentation de la position")
+    args = parser.parse_args(argv)
+    return 0 if run(args.depth, args.size, args.backend) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
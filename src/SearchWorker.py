@@ -0,0 +1,108 @@
+import queue
+import threading
+
+from AIPlayer import SearchTimeout, opponent
+
+
+# Recherche de l'IA dans un thread, pour ne pas bloquer la boucle Tk.
+# La recherche porte sur une copie de la position prise au lancement : l'interface peut continuer
+# à lire (ou modifier) la grille du contrôleur pendant ce temps.
+# Le résultat est déposé dans une file que l'interface vient relever avec after().
+class SearchWorker:
+    def __init__(self, ai, position):
+        self.ai = ai
+        self.position = position
+        self.results = queue.Queue()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _run(self):
+        self.ai.stop_event = self.stop_event
+        try:
+            move = self._search()
+        except SearchTimeout:
+            return
+        finally:
+            self.ai.stop_event = None
+        self._deliver(move)
+
+    def _search(self):
+        return self.ai.search_position(self.position)
+
+    def _deliver(self, move):
+        if not self.stop_event.is_set():
+            self.results.put(move)
+
+    def poll(self):
+        """Retourne (True, coup) si la recherche est terminée (coup None : pas de coup légal), sinon (False, None)"""
+        try:
+            return True, self.results.get_nowait()
+        except queue.Empty:
+            return False, None
+
+    def cancel(self):
+        """
+        Annule la recherche et attend que le thread s'arrête (l'IA vérifie l'annulation tous les 256 nœuds),
+        pour qu'une nouvelle recherche puisse réutiliser le même AIPlayer sans conflit.
+        """
+        self.stop_event.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+
+# Réflexion pendant le tour de l'adversaire (« ponder »).
+# Après son coup, l'IA suppose que l'adversaire jouera predicted_move et cherche déjà sa réponse.
+# - Si l'adversaire joue bien ce coup (ponderhit), la recherche en cours devient la recherche du coup :
+#   elle dispose alors du temps normal de l'IA à partir de cet instant, en plus du temps déjà passé.
+# - Sinon elle est annulée ; la table de transposition garde malgré tout le travail effectué.
+class PonderWorker(SearchWorker):
+    def __init__(self, ai, position, predicted_move):
+        super().__init__(ai, position)
+        self.predicted_move = predicted_move
+        self.position.make_move(predicted_move, opponent(ai.color))
+        self.lock = threading.Lock()
+        self.hit = False
+        self.finished = False
+        self.result = None
+        self.timer = None
+
+    def _search(self):
+        return self.ai.ponder_position(self.position)
+
+    def _deliver(self, move):
+        with self.lock:
+            self.finished = True
+            self.result = move
+            deliver = self.hit
+        if deliver:
+            self._put_result()
+
+    def _put_result(self):
+        if self.ai.clock is not None:
+            self.ai.clock.stop()
+        self.results.put(self.result)
+
+    def ponderhit(self):
+        """L'adversaire a joué le coup prévu : la réflexion devient la recherche du coup de l'IA"""
+        time_limit = self.ai.move_time(self.position)
+        if self.ai.clock is not None:
+            self.ai.clock.start()
+        with self.lock:
+            self.hit = True
+            finished = self.finished
+        if finished:
+            self._put_result()
+        elif time_limit is not None:
+            # En temps limité, la réflexion anticipée est illimitée : on l'arrête à la fin du temps imparti
+            self.timer = threading.Timer(time_limit, self.stop_event.set)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def cancel(self):
+        if self.timer is not None:
+            self.timer.cancel()
+        super().cancel()
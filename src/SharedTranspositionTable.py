@@ -0,0 +1,120 @@
+import weakref
+from multiprocessing import shared_memory
+
+# Table de transposition placée dans un bloc de mémoire partagée, utilisable par plusieurs processus.
+# Même organisation que TranspositionTable (seaux de deux entrées : préférence à la profondeur,
+# puis toujours remplacée), mais chaque entrée tient dans deux mots de 64 bits :
+#   mot 0 : clé XOR données     mot 1 : données
+# Il n'y a aucun verrou : une entrée à moitié écrite par un autre processus est détectée à la lecture,
+# car (mot 0 XOR mot 1) ne redonne alors plus la clé, et elle est simplement ignorée.
+#
+# Données (64 bits) : valeur (32) | profondeur (8) | borne (2) | coup + 1 (16) | génération (6)
+# Le premier mot du bloc contient la génération courante, commune à tous les processus, le second le nombre
+# de seaux (le bloc rattaché peut être arrondi à la taille d'une page : sa taille ne le donne pas).
+VALUE_OFFSET = 1 << 31
+HEADER_WORDS = 2
+
+
+def _pack(value, depth, flag, move, generation):
+    return ((value + VALUE_OFFSET)
+            | depth << 32
+            | flag << 40
+            | (move + 1) << 42
+            | generation << 58)
+
+
+def _release(words, shm, owner):
+    # La vue 'words' doit être libérée avant shm.close(), sinon BufferError (pointeurs exportés)
+    words.release()
+    shm.close()
+    if owner:
+        shm.unlink()
+
+
+class SharedTranspositionTable:
+    def __init__(self, size_mb=8, name=None):
+        """
+        Sans nom, crée un nouveau bloc de size_mb Mo (une seule fois, au démarrage) ;
+        avec le nom d'un bloc existant, s'y rattache (processus de calcul).
+        """
+        if name is None:
+            # Autant de seaux de 2 entrées (32 octets) que le budget en contient, sans arrondi à une puissance de 2
+            buckets = max(1, size_mb * 1024 * 1024 // 32)
+            self.shm = shared_memory.SharedMemory(create=True, size=8 * (HEADER_WORDS + buckets * 4))
+            self.owner = True
+        else:
+            # Les processus de calcul partagent le resource_tracker du créateur : c'est lui seul
+            # qui détruit le bloc (close), le rattachement n'a rien à désenregistrer
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.name = self.shm.name
+        self.words = self.shm.buf.cast('Q')
+        if self.owner:
+            self.words[1] = buckets
+        self.buckets = self.words[1]
+        self.capacity = self.buckets * 2
+        self.probes = 0
+        self.hits = 0
+        # Libération du bloc (et destruction par son créateur) même sans close() explicite : quand la table
+        # est ramassée, ou au plus tard à la sortie du programme
+        self._finalizer = weakref.finalize(self, _release, self.words, self.shm, self.owner)
+
+    def close(self):
+        """Libère le bloc (le détruit s'il a été créé ici) ; sans effet si c'est déjà fait"""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def generation(self):
+        return self.words[0]
+
+    def new_generation(self):
+        """Nouvelle partie : les entrées existantes deviennent remplaçables en priorité"""
+        self.words[0] = (self.words[0] + 1) & 0x3F
+
+    def hash_board(self, board, color):
+        return board.hash_key(color)
+
+    def store(self, board, depth, value, flag, best_move, color):
+        key = self.hash_board(board, color)
+        words = self.words
+        generation = words[0]
+        index = HEADER_WORDS + ((key % self.buckets) << 2)
+        data = words[index + 1]
+        stored_depth = (data >> 32) & 0xFF
+        if stored_depth and (data >> 58) == generation and depth < stored_depth:
+            index += 2  # l'entrée profonde est conservée, on écrit dans l'entrée « toujours remplacée »
+        move = best_move[0] * board.size + best_move[1] if best_move else -1
+        data = _pack(value, depth, flag, move, generation)
+        words[index] = key ^ data
+        words[index + 1] = data
+
+    def lookup(self, board, color):
+        """Retourne (profondeur, valeur, type de borne, meilleur coup) pour la position, ou None"""
+        key = self.hash_board(board, color)
+        words = self.words
+        index = HEADER_WORDS + ((key % self.buckets) << 2)
+        self.probes += 1
+        for entry in (index, index + 2):
+            data = words[entry + 1]
+            if words[entry] ^ data == key and data:
+                self.hits += 1
+                move = ((data >> 42) & 0xFFFF) - 1
+                best_move = divmod(move, board.size) if move >= 0 else None
+                return (data >> 32) & 0xFF, (data & 0xFFFFFFFF) - VALUE_OFFSET, (data >> 40) & 0x3, best_move
+        return None
+
+    def fill_rate(self, sample=10000):
+        """Taux de remplissage estimé sur les 'sample' premières entrées (un parcours complet serait trop lent)"""
+        count = min(sample, self.capacity)
+        words = self.words
+        used = sum(1 for i in range(count) if words[HEADER_WORDS + 2 * i + 1])
+        return used / count
+
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes else 0.0
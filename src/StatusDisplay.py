@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import font
-from PIL import ImageTk,Image
 
 class StatusDisplay(tk.Label):
     def __init__(self, parent):
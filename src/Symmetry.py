@@ -0,0 +1,160 @@
+# Symétries du plateau : un plateau carré a 8 symétries (groupe diédral), et une position et ses images
+# ont la même valeur et des coups correspondants. En ramenant chaque position à une forme canonique
+# (la plus petite de ses 8 images), la table de transposition et la bibliothèque d'ouvertures reconnaissent
+# une position déjà vue sous une autre orientation : jusqu'à 8 fois moins d'entrées pour autant de positions.
+#
+# Une transformation t (0 à 7) combine, dans cet ordre :
+#   t & 1 : symétrie haut/bas     (x, y) -> (size - 1 - x, y)
+#   t & 2 : symétrie gauche/droite (x, y) -> (x, size - 1 - y)
+#   t & 4 : transposition          (x, y) -> (y, x)
+# En 8x8, les masques sont transformés par manipulation de bits (inversion des octets, échanges de bits) ;
+# pour les autres tailles, bit à bit par une table de correspondance des cases (peu de pions en ouverture).
+
+from BitBoard import get_zobrist
+
+SYMMETRIES = 8
+
+# Masques des échanges de bits, répétés sur 128 bits : les pions 'O' (bits 0 à 63) et 'X' (bits 64 à 127)
+# d'une position 8x8 sont transformés ensemble, en une seule opération sur un entier de 128 bits
+_M1 = 0x5555555555555555 * (1 + (1 << 64))
+_M2 = 0x3333333333333333 * (1 + (1 << 64))
+_M4 = 0x0F0F0F0F0F0F0F0F * (1 + (1 << 64))
+_K1 = 0x5500550055005500 * (1 + (1 << 64))
+_K2 = 0x3333000033330000 * (1 + (1 << 64))
+_K4 = 0x0F0F0F0F00000000 * (1 + (1 << 64))
+_LOW = (1 << 64) - 1
+
+# Image de chaque case (bit) par chaque transformation, par taille de plateau
+_PERMUTATIONS = {}
+
+
+def transform_square(move, t, size):
+    """Image de la case move=(x, y) par la transformation t"""
+    x, y = move
+    if t & 1:
+        x = size - 1 - x
+    if t & 2:
+        y = size - 1 - y
+    if t & 4:
+        x, y = y, x
+    return x, y
+
+
+def inverse_square(move, t, size):
+    """Antécédent de la case move=(x, y) par la transformation t (transformation inverse)"""
+    x, y = move
+    if t & 4:
+        x, y = y, x
+    if t & 2:
+        y = size - 1 - y
+    if t & 1:
+        x = size - 1 - x
+    return x, y
+
+
+def _flip_vertical_8(pair):
+    # La ligne x est l'octet x : inverser l'ordre des 16 octets inverse les lignes et échange les deux moitiés,
+    # qu'on remet en place
+    pair = int.from_bytes(pair.to_bytes(16, "little"), "big")
+    return (pair >> 64) | ((pair & _LOW) << 64)
+
+
+def _mirror_horizontal_8(pair):
+    # Inversion des bits de chaque octet (colonne y -> 7 - y)
+    pair = ((pair >> 1) & _M1) | ((pair & _M1) << 1)
+    pair = ((pair >> 2) & _M2) | ((pair & _M2) << 2)
+    return ((pair >> 4) & _M4) | ((pair & _M4) << 4)
+
+
+def _transpose_8(pair):
+    # Échanges de blocs de part et d'autre de la diagonale : 4x4, puis 2x2, puis 1x1
+    t = _K4 & (pair ^ (pair << 28))
+    pair ^= t ^ (t >> 28)
+    t = _K2 & (pair ^ (pair << 14))
+    pair ^= t ^ (t >> 14)
+    t = _K1 & (pair ^ (pair << 7))
+    return pair ^ t ^ (t >> 7)
+
+
+def _images_8(o, x):
+    """Les 8 images d'une position 8x8, dans l'ordre des transformations : entiers x << 64 | o"""
+    pair = (x << 64) | o
+    v = _flip_vertical_8(pair)
+    h = _mirror_horizontal_8(pair)
+    vh = _mirror_horizontal_8(v)
+    return (pair, v, h, vh,
+            _transpose_8(pair), _transpose_8(v), _transpose_8(h), _transpose_8(vh))
+
+
+def get_permutations(size):
+    """Pour chaque transformation, le bit image de chaque case (indice x * size + y)"""
+    permutations = _PERMUTATIONS.get(size)
+    if permutations is None:
+        permutations = []
+        for t in range(SYMMETRIES):
+            images = []
+            for i in range(size * size):
+                x, y = transform_square(divmod(i, size), t, size)
+                images.append(1 << (x * size + y))
+            permutations.append(tuple(images))
+        permutations = _PERMUTATIONS[size] = tuple(permutations)
+    return permutations
+
+
+def _images(mask, size):
+    """Les 8 images d'un masque, dans l'ordre des transformations"""
+    if size == 8:
+        return tuple(image & _LOW for image in _images_8(mask, 0))
+    images = []
+    for permutation in get_permutations(size):
+        image = 0
+        rest = mask
+        while rest:
+            low = rest & -rest
+            image |= permutation[low.bit_length() - 1]
+            rest ^= low
+        images.append(image)
+    return images
+
+
+def transform_mask(mask, t, size):
+    """Image d'un masque de cases par la transformation t"""
+    return _images(mask, size)[t]
+
+
+def canonical(o, x, size):
+    """
+    Forme canonique de la position (pions 'O', pions 'X') : la plus petite de ses 8 images
+    (comparées par x, puis par o). Retourne (o canonique, x canonique, t) où t transforme la position
+    en sa forme canonique.
+    """
+    if size == 8:
+        images = _images_8(o, x)
+        best = min(images)
+        return best & _LOW, best >> 64, images.index(best)
+    best = None
+    for t, image in enumerate(zip(_images(x, size), _images(o, size))):
+        if best is None or image < best:
+            best = image
+            best_t = t
+    return best[1], best[0], best_t
+
+
+def canonical_key(board, color):
+    """
+    Clé de Zobrist de la forme canonique de 'board' (trait compris), et transformation t qui y mène :
+    un coup de 'board' se ramène à la forme canonique par transform_square(coup, t), et inversement.
+    """
+    size, o, x = board.encode()
+    o, x, t = canonical(o, x, size)
+    z_o, z_x, _, z_side = get_zobrist(size)
+    key = z_side if color == 'X' else 0
+    while o:
+        low = o & -o
+        key ^= z_o[low.bit_length() - 1]
+        o ^= low
+    while x:
+        low = x & -x
+        key ^= z_x[low.bit_length() - 1]
+        x ^= low
+    return key, t
@@ -1,8 +1,9 @@
-from GameBoard import GameBoardInterface
+from GameBoard import RENDERERS, GameBoardInterface
 from GameController import GameController, opponent
-from AIPlayer import AIPlayer
+from AIPlayer import AIPlayer, board_settings
 import tkinter as tk
-from PIL import Image, ImageTk
+from AssetCache import load_photo
+from OpeningBook import get_book
 from StatusDisplay import StatusDisplay
 from MenuBar import MenuBar
 import time
@@ -10,26 +11,28 @@ import time
 SCREEN_SIZE = 1000
 
 class OthelloApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, size=8, renderer=None):
+        """
+        size : côté du plateau ; renderer : rendu du plateau ("buttons" ou "canvas", voir GameBoardInterface),
+        choisi selon la taille par défaut
+        """
         super().__init__()
+        # Taille du plateau de la partie suivante, quand le joueur en change depuis le menu (voir change_size)
+        self.next_size = None
+        self.renderer = renderer
 
         self.title("Othello")
-        self.bg_image = Image.open("./layout/fond_bois.png")
-        if hasattr(Image, 'Resampling'):
-            self.bg_image = self.bg_image.resize((SCREEN_SIZE, SCREEN_SIZE), Image.Resampling.LANCZOS)
-        else:
-            self.bg_image = self.bg_image.resize((SCREEN_SIZE, SCREEN_SIZE), Image.ANTIALIAS)
-
-        self.bg_image = ImageTk.PhotoImage(self.bg_image)
+        # Fond redimensionné une seule fois puis relu depuis le cache d'images (voir AssetCache)
+        self.bg_image = load_photo("./layout/fond_bois.png", (SCREEN_SIZE, SCREEN_SIZE))
 
         # Créer un Label pour l'image de fond
         self.bg_label = tk.Label(self, image=self.bg_image)
         self.bg_label.place(relwidth=1, relheight=1)  # Assurer que l'image occupe toute la fenêtre
 
         # Initialiser les autres composants
-        self.controller = GameController()  # Tu dois avoir un GameController défini ailleurs
+        self.controller = GameController(size)  # Tu dois avoir un GameController défini ailleurs
         self.status_display = StatusDisplay(self)  # Assurez-vous que StatusDisplay est défini
-        self.game_board = GameBoardInterface(self, self.controller)  # Assurez-vous que GameBoard est défini
+        self.game_board = GameBoardInterface(self, self.controller, renderer)  # Assurez-vous que GameBoard est défini
         self.menu = MenuBar(self, self.controller)  # Assurez-vous que MenuBar est défini
 
         # Passer en mode plein écran
@@ -47,17 +50,30 @@ class OthelloApp(tk.Tk):
     def update_status(self, message, color="white"):
         self.status_display.update_status(message, color)
 
+    def change_size(self, size):
+        """
+        Nouvelle partie sur un plateau size x size : la fenêtre est fermée et main() la recrée à la nouvelle taille
+        (détruire la fenêtre détruit aussi les rappels after en attente de l'ancien plateau)
+        """
+        if size == self.controller.size:
+            return
+        self.game_board.cancel_search()
+        self.next_size = size
+        self.destroy()
 
-def main():
+
+def main(size=8, renderer=None):
     # Print rules
     print("Welcome to Othello!")
-    print("The game is played on a " + str(8) + "x" + str(8) + " board.")
+    print("The game is played on a " + str(size) + "x" + str(size) + " board (Game > Board Size to change it).")
     print("Turns alternate between White (X) and Red (O). White goes first.")
     print("To enable AI for a player, use the Game menu.")
     print("To change the AI type, use the AI menu. (Minimax, Greedy, Random)")
 
-    app = OthelloApp()
-    app.mainloop()
+    while size:
+        app = OthelloApp(size, renderer)
+        app.mainloop()
+        size = app.next_size
 
 
 def play_console_game():
@@ -88,10 +104,11 @@ def play_console_game():
 
         ai_color = opponent(human_color)
         # Ici, on fixe une profondeur élevée tout en espérant que mtd(f) accélère la recherche
-        ai_player[ai_color] = AIPlayer(ai_color, max_depth=8)
+        # (profondeur du 8x8, ramenée à la taille du plateau ; temps limité sur les grands plateaux)
+        ai_player[ai_color] = AIPlayer(ai_color, book=get_book(size), **board_settings(size, 8))
     else:
-        ai_player['O'] = AIPlayer('O', max_depth=6)
-        ai_player['X'] = AIPlayer('X', max_depth=6)
+        ai_player['O'] = AIPlayer('O', book=get_book(size), **board_settings(size, 6))
+        ai_player['X'] = AIPlayer('X', book=get_book(size), **board_settings(size, 6))
 
     current_color = 'O'
     while not board.game_over():
@@ -138,5 +155,63 @@ def play_console_game():
 
 
 
+def startup_report(runs=5):
+    """
+    Temps de démarrage de l'interface (lancement de Python jusqu'à la première fenêtre dessinée),
+    à froid (cache d'images vidé) puis à chaud, chaque mesure dans un nouveau processus.
+    Sans affichage, la fenêtre ne peut pas être créée : on mesure alors les imports et la préparation
+    des images (redimensionnement ou lecture du cache), c'est-à-dire tout ce que le cache a changé.
+    """
+    import os
+    import subprocess
+    import sys
+    from AssetCache import clear_cache
+
+    try:
+        tk.Tk().destroy()
+        headless = False
+        code = ("import time; start = time.perf_counter(); import main; app = main.OthelloApp(); app.update(); "
+                "print(time.perf_counter() - start); app.destroy()")
+    except tk.TclError:
+        headless = True
+        code = ("import time; start = time.perf_counter(); import main, GameBoard; "
+                "from AssetCache import scaled_image_path; "
+                "cell = min(GameBoard.CELL_PIXELS * GameBoard.HEIGHT, GameBoard.BOARD_PIXELS // 8); "
+                "scaled_image_path('./layout/fond_bois.png', (main.SCREEN_SIZE, main.SCREEN_SIZE)); "
+                "[scaled_image_path(f'./layout/{name}.png', (cell, cell)) for name in ('transparent', 'jeton_x', 'jeton_o')]; "
+                "print(time.perf_counter() - start)")
+
+    def launch():
+        begin = time.perf_counter()
+        inside = float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True,
+                                      cwd=os.path.dirname(os.path.abspath(__file__))).stdout.split()[-1])
+        return time.perf_counter() - begin, inside
+
+    clear_cache()
+    cold = launch()
+    warm = [launch() for _ in range(runs)]
+    warm_total = min(total for total, inside in warm)
+    warm_inside = min(inside for total, inside in warm)
+    if headless:
+        print("Pas d'affichage : imports et préparation des images seulement (la fenêtre n'est pas créée)")
+    measured = "imports + images" if headless else "imports + fenêtre"
+    print(f"{'démarrage':>10} {'processus':>10} {measured:>18}")
+    print(f"{'à froid':>10} {cold[0]:>9.3f}s {cold[1]:>17.3f}s")
+    print(f"{'à chaud':>10} {warm_total:>9.3f}s {warm_inside:>17.3f}s   (meilleur de {runs})")
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Othello")
+    parser.add_argument("--size", type=int, default=8, help="côté du plateau (pair, 8 par défaut)")
+    parser.add_argument("--renderer", choices=sorted(RENDERERS),
+                        help="rendu du plateau (par défaut : boutons, Canvas pour les grands plateaux)")
+    parser.add_argument("--startup-report", action="store_true", help="mesurer le temps de démarrage")
+    args = parser.parse_args()
+    if args.size < 4 or args.size % 2:
+        parser.error("la taille doit être un nombre pair >= 4")
+    if args.startup_report:
+        startup_report()
+    else:
+        main(args.size, args.renderer)
\ No newline at end of file
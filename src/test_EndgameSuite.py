@@ -0,0 +1,34 @@
+# Tests de EndgameSolver sur la suite de fin de partie (endgame_suite.txt) : meilleur coup et score exact,
+# puis résultat gagné / nul / perdu par la fenêtre [-1, 1].
+#
+#   python -m unittest test_EndgameSuite      (ou python -m pytest, depuis src)
+
+import unittest
+
+from EndgameSolver import EndgameSolver
+from EndgameSuite import load_suite
+
+
+class EndgameSuiteTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.positions = load_suite()
+
+    def test_suite_is_solved(self):
+        self.assertTrue(self.positions)
+        for number, board, color, best_moves, expected in self.positions:
+            with self.subTest(line=number):
+                self.assertIsNotNone(best_moves, "position sans solution : EndgameSuite.py --complete")
+                move, score = EndgameSolver(board).solve(color)
+                self.assertIn(move, best_moves)
+                self.assertEqual(score, expected)
+
+    def test_win_loss_draw(self):
+        for number, board, color, best_moves, expected in self.positions:
+            with self.subTest(line=number):
+                _, result = EndgameSolver(board).solve(color, exact=False)
+                self.assertEqual(result, (expected > 0) - (expected < 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# Tests de ListBoard : pile des pions retournés et retour exact à la position après make_move/undo_move.
+#
+#   python -m unittest test_ListBoard      (ou python -m pytest, depuis src)
+
+import random
+import unittest
+
+from AIPlayer import AIPlayer, opponent
+from BitBoard import BitBoard
+from GameController import get_weights
+from ListBoard import ListBoard
+
+
+def state(board):
+    """Ce que make_move/undo_move tiennent à jour, plus le sommet de la pile"""
+    return board.cells[:], board.key, board.score, board.count_o, board.count_x, board._sp
+
+
+def walk(board, color, depth):
+    """Parcourt tout l'arbre des coups sur 'depth' demi-coups en jouant puis annulant chaque coup"""
+    if depth == 0:
+        return
+    moves = board.get_legal_moves(color)
+    if not moves:
+        walk(board, opponent(color), depth - 1)
+        return
+    for move in moves:
+        before = state(board)
+        flips = board.make_move(move, color)
+        walk(board, opponent(color), depth - 1)
+        board.undo_move(move, flips, color)
+        assert state(board) == before
+
+
+class ListBoardStackTest(unittest.TestCase):
+    def test_tree_walk_leaves_stack_unchanged(self):
+        board = ListBoard(8, get_weights(8))
+        start = state(board)
+        length = len(board._stack)
+        walk(board, 'O', 6)
+        self.assertEqual(state(board), start)
+        self.assertEqual(len(board._stack), length)
+
+    def test_stack_does_not_grow_across_searches(self):
+        # Une partie au hasard, puis deux recherches complètes depuis la même position : la pile revient
+        # à son sommet et la seconde recherche ne l'agrandit plus
+        rng = random.Random(1)
+        board = ListBoard(8, get_weights(8))
+        color = 'O'
+        for _ in range(30):
+            moves = board.get_legal_moves(color)
+            if moves:
+                board.make_move(rng.choice(moves), color)
+            color = opponent(color)
+        start = state(board)
+        lengths = []
+        for _ in range(2):
+            ai = AIPlayer(color, max_depth=4, endgame_empties=None, wld_empties=None)
+            ai.search_position(board)
+            self.assertEqual(state(board), start)
+            lengths.append(len(board._stack))
+        self.assertEqual(lengths[0], lengths[1])
+
+    def test_same_moves_as_bitboard(self):
+        rng = random.Random(2)
+        lists, bits = ListBoard(8, get_weights(8)), BitBoard(8, get_weights(8))
+        color = 'O'
+        while not bits.game_over():
+            moves = bits.get_legal_moves(color)
+            self.assertEqual(sorted(lists.get_legal_moves(color)), sorted(moves))
+            if moves:
+                move = rng.choice(moves)
+                self.assertEqual(lists.make_move(move, color), len(bits.flipped_squares(bits.make_move(move, color))))
+                self.assertEqual(lists.hash_key(color), bits.hash_key(color))
+            color = opponent(color)
+
+    def test_undo_out_of_order_is_detected(self):
+        board = ListBoard(8, get_weights(8))
+        with self.assertRaises(AssertionError):
+            board.undo_move((2, 3), 1, 'O')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+# Tests de la génération des coups : comptes perft de référence (Perft.PERFT_COUNTS) avec chaque représentation.
+#
+#   python -m unittest test_Perft      (ou python -m pytest, depuis src)
+
+import unittest
+
+from GameController import BACKENDS, GameController
+from Perft import PERFT_COUNTS
+
+# Nombre de feuilles au-delà duquel une profondeur n'est pas testée (durée du test), par représentation
+MAX_LEAVES = {"numpy": 10000}
+DEFAULT_MAX_LEAVES = 60000
+
+
+class PerftTest(unittest.TestCase):
+    def test_reference_counts(self):
+        for backend in sorted(BACKENDS):
+            max_leaves = MAX_LEAVES.get(backend, DEFAULT_MAX_LEAVES)
+            for size, counts in PERFT_COUNTS.items():
+                board = GameController(size, backend=backend)
+                for depth, expected in enumerate(counts):
+                    if expected > max_leaves:
+                        break
+                    with self.subTest(backend=backend, size=size, depth=depth):
+                        self.assertEqual(board.perft(depth), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()